@@ -2,6 +2,7 @@ import os
 import random
 import logging
 import asyncio
+import functools
 from typing import Optional
 from pathlib import Path
 
@@ -17,6 +18,27 @@ from config import AUDIO_BASE_PATH, AUDIO_VOLUME
 AUDIO_DIR = Path(__file__).parent / 'audio'
 logger = logging.getLogger(__name__)
 
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+
+
+# ============================================================================
+# DECODED SOUND CACHE
+# ============================================================================
+
+@functools.lru_cache(maxsize=64)
+def _load_sound(path: str):
+    """Decode an audio file once - later plays reuse the pygame Sound"""
+    return pygame.mixer.Sound(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _folder_audio_files(folder_path: str) -> tuple:
+    """Audio files in a folder, listed once per folder"""
+    folder = Path(folder_path)
+    if not folder.is_dir():
+        return ()
+    return tuple(f for ext in AUDIO_EXTENSIONS for f in folder.glob(f'*{ext}'))
+
 
 # ============================================================================
 # AUDIO CONTEXT REGISTRY
@@ -159,14 +181,14 @@ class AudioManager:
             audio_file = random.choice(self.contexts[context])
             logger.info(f"[AUDIO] Playing: {context} -> {audio_file.name}")
 
-            # Load and play with CURRENT volume
-            sound = pygame.mixer.Sound(str(audio_file))
+            # Play (decoded on first use) with CURRENT volume
+            sound = _load_sound(str(audio_file))
             sound.set_volume(self.current_volume)  # Use stored volume
             sound.play()
 
             # Get and return duration
             duration = sound.get_length()
-            logger.debug(f"[AUDIO] Duration: {duration:.2f}s at {int(self.current_volume * 100)}% volume")
+            logger.debug("[AUDIO] Duration: %.2fs at %d%% volume", duration, self.current_volume * 100)
             return duration
 
         except Exception as e:
@@ -246,6 +268,7 @@ class AudioManager:
     def cleanup(self):
         """Cleanup audio system"""
         self.stop_white_noise()
+        _load_sound.cache_clear()  # Sounds are invalid once the mixer quits
         if self.audio_available:
             pygame.mixer.quit()
 
@@ -417,8 +440,8 @@ def play_intro_audio() -> float:
         # Stop any currently playing audio
         pygame.mixer.stop()
 
-        # Load and play with current volume
-        sound = pygame.mixer.Sound(str(intro_file))
+        # Play (decoded on first use) with current volume
+        sound = _load_sound(str(intro_file))
         sound.set_volume(audio_manager.current_volume)
         sound.play()
 
@@ -432,6 +455,13 @@ def play_intro_audio() -> float:
         return 0.0
 
 
+def stop_audio(fade_ms: int = 30):
+    """Stop everything the mixer is playing (e.g. to skip an intro) with a short click-free fade"""
+    if not AUDIO_AVAILABLE:
+        return
+    pygame.mixer.fadeout(fade_ms)
+
+
 def play_audio_from_folder(folder_path: str, description: str = "") -> float:
     """
     Play random audio file from a custom folder
@@ -449,10 +479,8 @@ def play_audio_from_folder(folder_path: str, description: str = "") -> float:
             logger.warning(f"Audio folder not found: {folder_path}")
             return 0.0
 
-        # Get all audio files in folder
-        audio_files = []
-        for ext in ['.mp3', '.wav', '.ogg']:
-            audio_files.extend(Path(folder_path).glob(f'*{ext}'))
+        # Get all audio files in folder (listed once, then cached)
+        audio_files = _folder_audio_files(folder_path)
 
         if not audio_files:
             logger.warning(f"No audio files found in: {folder_path}")
@@ -463,8 +491,8 @@ def play_audio_from_folder(folder_path: str, description: str = "") -> float:
 
         logger.info(f"[AUDIO] Playing: {folder_path} -> {audio_file.name}")
 
-        # Load and play
-        sound = pygame.mixer.Sound(str(audio_file))
+        # Play (decoded on first use, cached for later games)
+        sound = _load_sound(str(audio_file))
         sound.set_volume(AUDIO_VOLUME)
         sound.play()
 
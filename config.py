@@ -118,9 +118,13 @@ SENSOR_PATIENCE_TIME = 1 * 3600  # 2 HOURS patience for sensor reconnection
 # ============================================================================
 # NETWORK
 # ============================================================================
-NETWORK_RETRY_DELAY = 2
+NETWORK_RETRY_DELAY = 0.5
 NETWORK_MAX_RETRIES = 3
+NETWORK_REQUEST_TIMEOUT = 1.0  # Per attempt - healthy Shelly answers in <50ms on LAN
+NETWORK_CONNECT_TIMEOUT = 0.3
+NETWORK_TOTAL_TIMEOUT = 2.0    # Deadline across all attempts of one call
 BUTTON_CHECK_INTERVAL = 0.1
+BUTTON_POLL_INTERVAL = 0.3  # Background button poller refresh (~3Hz)
 
 # ============================================================================
 # LIGHTING BEHAVIOR
@@ -132,6 +136,7 @@ BULB_SAFETY_TIMEOUT = 8  # Turn off after 8 sec if never achieved
 # HARDWARE MONITORING
 # ============================================================================
 HARDWARE_MONITOR_INTERVAL = 10  # Check every 10 seconds for reconnection
+END_STATE_HEALTHY_INTERVAL = 60  # Re-assert plug/bulbs ON after game end when all are online
 
 # ============================================================================
 # TESTING MODE
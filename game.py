@@ -21,8 +21,6 @@ from hardware import *
 from audio import *
 
 # Import sensor system
-import sys
-sys.path.append('.')
 from main_wit import SensorDataQueue, SensorState
 from video_recorder import VideoRecorder
 
@@ -30,6 +28,10 @@ from video_recorder import VideoRecorder
 
 logger = logging.getLogger(__name__)
 
+# Report separator lines
+_SEP80 = "=" * 80 + "\n"
+_RULE80 = "-" * 80 + "\n"
+
 
 
 def log_with_time(message: str, level="INFO"):
@@ -81,6 +83,7 @@ class UpDownGame:
         # Time tracking
         self.start_time: Optional[datetime] = None
         self.deadline: Optional[datetime] = None
+        self.start_str: Optional[str] = None  # start_time pre-formatted for reports
         self.game_time = 0.0
 
         # Training time accounting
@@ -129,15 +132,19 @@ class UpDownGame:
 
         self.total_extension_time_used = 0  # Seconds of extension used
         self.total_extension_requests = 0  # Total requests made (for rapid eligibility)
-        self.last_extension_request_time = 0  # When last request was made
+        self.last_extension_request_time = -EXTENSION_REQUEST_COOLDOWN  # When last request was made (monotonic)
         self.extension_active = False  # Is extension currently active
-        self.extension_start_time = 0  # When current extension started
+        self.extension_start_ns = 0  # When current extension started (monotonic ns)
         self.extension_qualified = False  # Is subject qualified for extension?
         self.void_occurred = False
         self.extension_fan_triggered = False  # Has fan been activated this extension
-        self.extension_fan_trigger_time = 0  # When fan should activate
+        self.extension_fan_trigger_ns = 0  # Fan activation offset from extension start (ns)
+        self._last_logged_minute = 0  # Last extension minute written to the log
         self._last_button_1_value = 0  # For button edge detection
         self._last_button_2_value = 0  # For button edge detection
+        self._extension_log_task = None  # Minute progress logger while extension runs
+        self._fan_timer = None  # One-shot timer that fires the extension fan
+        self._fan_task = None
         self.break_start_time = 0
         self.current_break_duration = 0  # ADD THIS LINE
         self.break_duration = 0
@@ -172,6 +179,11 @@ class UpDownGame:
         self.last_void_shock_times = []
         self.video_recorder = VideoRecorder(enabled=VIDEO_RECORDING_ENABLED)
 
+        # Per-tick state handlers (other states drive themselves via the round/break chain)
+        self._state_handlers = {
+            GameState.WAITING: self._update_waiting,
+        }
+
         # ============ NEW: Enhanced Statistics Tracking ============
         # Position-specific statistics
         self.up_positions_commanded = 0
@@ -351,12 +363,12 @@ class UpDownGame:
 
             with open(report_file, 'w') as f:
                 # Header
-                f.write("=" * 80 + "\n")
+                f.write(_SEP80)
                 f.write("SESSION PERFORMANCE SUMMARY\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Session Date: {self.session_start.strftime('%B %d, %Y')}\n")
-                f.write(f"Start Time: {self.session_start.strftime('%H:%M:%S')}\n")
-                f.write(f"End Time: {self.session_end.strftime('%H:%M:%S')}\n")
+                f.write(_SEP80)
+                f.write(f"Session Date: {self.session_start:%B %d, %Y}\n")
+                f.write(f"Start Time: {self.session_start:%H:%M:%S}\n")
+                f.write(f"End Time: {self.session_end:%H:%M:%S}\n")
 
                 total_duration = (self.session_end - self.session_start).total_seconds()
                 hours = int(total_duration // 3600)
@@ -375,7 +387,7 @@ class UpDownGame:
 
                 # Training Goals
                 f.write("TRAINING GOALS\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
                 f.write(f"Training Goal: {self.training_goal / 60:.1f} minutes\n")
                 f.write(f"Time Completed: {self.completed_training_time / 60:.1f} minutes\n")
                 f.write(f"Penalties Added: {self.penalty_time_added / 60:.1f} minutes\n")
@@ -388,7 +400,7 @@ class UpDownGame:
 
                 # Position Statistics
                 f.write("POSITION STATISTICS\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
                 f.write("UP Position:\n")
                 f.write(f"  Commands: {self.up_positions_commanded}\n")
                 f.write(f"  Achieved: {self.up_positions_achieved} ({stats['up_success_rate']:.1f}%)\n")
@@ -412,7 +424,7 @@ class UpDownGame:
                 # Violation Analysis
                 total_violations = self.up_violations_count + self.down_violations_count
                 f.write("VIOLATION ANALYSIS\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
                 f.write(f"Total Violations: {total_violations}\n")
                 transition_total = self.up_transition_violations + self.down_transition_violations
                 hold_total = self.up_hold_violations + self.down_hold_violations
@@ -440,7 +452,7 @@ class UpDownGame:
 
                 # Punishment Statistics
                 f.write("PUNISHMENT STATISTICS\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
                 f.write(f"Total Shocks Delivered: {self.total_shock_count}\n")
                 void_count = len([r for r in self.round_history if not r.get('passed', True) and r.get('total_violations', 0) >= MAX_PISHOCK_CYCLES])
                 f.write(f"Void Rounds: {void_count}\n")
@@ -449,7 +461,7 @@ class UpDownGame:
 
                 # Round Summary
                 f.write("ROUND SUMMARY\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
                 f.write(f"Total Rounds: {len(self.round_history)}\n")
                 easy_count = len([r for r in self.round_history if r['level'] == 'easy'])
                 medium_count = len([r for r in self.round_history if r['level'] == 'medium'])
@@ -466,7 +478,7 @@ class UpDownGame:
 
                 # Break Analysis
                 f.write("BREAK ANALYSIS\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
                 f.write(f"Total Break Time: {int(self.total_break_time // 60)}m {int(self.total_break_time % 60)}s\n")
                 f.write(f"Total Extension Time: {int(self.total_extension_time_actual // 60)}m {int(self.total_extension_time_actual % 60)}s\n")
                 f.write(f"Extension Requests: {self.total_extension_requests}\n")
@@ -474,7 +486,7 @@ class UpDownGame:
 
                 # Time Distribution
                 f.write("TIME DISTRIBUTION\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
                 active_time = self.completed_training_time
                 f.write(f"Active Training: {int(active_time // 3600)}h {int((active_time % 3600) // 60)}m ({active_time/total_duration*100:.1f}%)\n")
                 f.write(f"Breaks: {int(self.total_break_time // 60)}m ({self.total_break_time/total_duration*100:.1f}%)\n")
@@ -485,7 +497,7 @@ class UpDownGame:
                 # Performance Trends
                 if len(self.round_history) >= 3:
                     f.write("PERFORMANCE TRENDS\n")
-                    f.write("-" * 80 + "\n")
+                    f.write(_RULE80)
                     third = len(self.round_history) // 3
                     f.write(f"Early Performance (Rounds 1-{third}):\n")
                     f.write(f"  Avg Violations: {stats['early_avg_violations']:.1f}/round\n")
@@ -501,7 +513,7 @@ class UpDownGame:
 
                 # Level-Specific Performance
                 f.write("LEVEL-SPECIFIC PERFORMANCE\n")
-                f.write("-" * 80 + "\n")
+                f.write(_RULE80)
 
                 for level_name, level_rounds in [('EASY', [r for r in self.round_history if r['level'] == 'easy']),
                                                   ('MEDIUM', [r for r in self.round_history if r['level'] == 'medium']),
@@ -515,9 +527,9 @@ class UpDownGame:
                         f.write(f"  Average: {avg:.1f} violations\n")
                         f.write("\n")
 
-                f.write("=" * 80 + "\n")
+                f.write(_SEP80)
                 f.write("END OF SESSION REPORT\n")
-                f.write("=" * 80 + "\n")
+                f.write(_SEP80)
 
             logger.info(f"✓ Session performance report generated: {report_file}")
 
@@ -535,15 +547,17 @@ class UpDownGame:
             self.report_file = f"training_report_{timestamp}.txt"
 
             with open(self.report_file, 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write("UP/DOWN TRAINING GAME - SESSION REPORT\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Report Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Status: PENDING START\n")
-                f.write(f"Training Goal: {self.training_goal / 60:.1f} minutes\n")
-                f.write(f"Testing Mode: {'YES' if TESTING_MODE else 'NO'}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write("Waiting for game to start...\n\n")
+                f.write("".join([
+                    _SEP80,
+                    "UP/DOWN TRAINING GAME - SESSION REPORT\n",
+                    _SEP80,
+                    f"Report Created: {datetime.now():%Y-%m-%d %H:%M:%S}\n",
+                    "Status: PENDING START\n",
+                    f"Training Goal: {self.training_goal / 60:.1f} minutes\n",
+                    f"Testing Mode: {'YES' if TESTING_MODE else 'NO'}\n",
+                    _SEP80 + "\n",
+                    "Waiting for game to start...\n\n",
+                ]))
 
             logger.info(f"✓ Report file created: {self.report_file}")
 
@@ -560,15 +574,17 @@ class UpDownGame:
 
         try:
             with open(self.report_file, 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write("UP/DOWN TRAINING GAME - SESSION REPORT\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Session Start: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Deadline: {self.deadline.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Game Duration: {GAME_DURATION_HOURS} hours\n")
-                f.write(f"Training Goal: {self.training_goal / 60:.1f} minutes\n")
-                f.write(f"Testing Mode: {'YES' if TESTING_MODE else 'NO'}\n")
-                f.write("=" * 80 + "\n\n")
+                f.write("".join([
+                    _SEP80,
+                    "UP/DOWN TRAINING GAME - SESSION REPORT\n",
+                    _SEP80,
+                    f"Session Start: {self.start_str}\n",
+                    f"Deadline: {self.deadline:%Y-%m-%d %H:%M:%S}\n",
+                    f"Game Duration: {GAME_DURATION_HOURS} hours\n",
+                    f"Training Goal: {self.training_goal / 60:.1f} minutes\n",
+                    f"Testing Mode: {'YES' if TESTING_MODE else 'NO'}\n",
+                    _SEP80 + "\n",
+                ]))
 
             logger.info(f"✓ Report file updated with start info")
 
@@ -598,9 +614,9 @@ class UpDownGame:
         try:
             with open(self.report_file, 'a') as f:
                 round_time = datetime.now().strftime('%B %d, %Y %H:%M:%S')
-                f.write(f"\n{'=' * 80}\n")
+                f.write("\n" + _SEP80)
                 f.write(f"ROUND {self.round_number} - {round_time}\n")
-                f.write(f"{'=' * 80}\n")
+                f.write(_SEP80)
                 # Use saved level (level that was actually played)
                 played_level = getattr(self, '_last_round_level', self.current_level)
                 f.write(f"Level: {played_level.upper()}\n")
@@ -652,7 +668,7 @@ class UpDownGame:
                 if not passed and hasattr(self, '_last_round_passed') and self._last_round_passed is False:
                     f.write(f"  Violation limit exceeded\n")
 
-                f.write(f"{'=' * 80}\n")
+                f.write(_SEP80)
 
                 # Log break information if available
                 if self.last_break_start_time and self.last_break_end_time:
@@ -685,9 +701,9 @@ class UpDownGame:
         """Log break details to report file"""
         break_duration = (self.last_break_end_time - self.last_break_start_time).total_seconds()
 
-        f.write(f"\n{'=' * 80}\n")
+        f.write("\n" + _SEP80)
         f.write(f"BREAK AFTER ROUND {self.round_number}\n")
-        f.write(f"{'=' * 80}\n")
+        f.write(_SEP80)
         f.write(f"Start: {self.last_break_start_time.strftime('%B %d, %Y %H:%M:%S')}\n")
         f.write(f"End: {self.last_break_end_time.strftime('%B %d, %Y %H:%M:%S')}\n")
         f.write(f"Type: {self.last_break_type.upper()}\n")
@@ -711,7 +727,7 @@ class UpDownGame:
             else:
                 f.write(f"  Fan Not Triggered (extension too short)\n")
 
-        f.write(f"{'=' * 80}\n")
+        f.write(_SEP80)
 
     def get_board_angle(self) -> Optional[float]:
         """
@@ -872,6 +888,8 @@ class UpDownGame:
         logger.info(f"Waiting up to {SENSOR_PATIENCE_TIME / 3600:.1f} hours for sensor reconnection...")
 
         patience_start = time.time()
+        next_progress_log = 300
+        updated = self.sensor_queue.updated_event()
 
         while self.both_sensors_lost:
             # Check elapsed time
@@ -885,8 +903,12 @@ class UpDownGame:
                 await self.end_game()
                 return
 
-            # Check every 5 seconds
-            await asyncio.sleep(5)
+            # Sleep until a sensor frame arrives (or at most a minute for deadline/progress checks)
+            updated.clear()
+            try:
+                await asyncio.wait_for(updated.wait(), timeout=min(60, SENSOR_PATIENCE_TIME - elapsed))
+            except asyncio.TimeoutError:
+                pass
 
             # Update sensor status
             self.check_both_sensors_lost()
@@ -899,7 +921,9 @@ class UpDownGame:
                 return
 
             # Log progress every 5 minutes
-            if elapsed > 0 and int(elapsed) % 300 == 0:
+            elapsed = time.time() - patience_start
+            if elapsed >= next_progress_log:
+                next_progress_log += 300
                 remaining = (SENSOR_PATIENCE_TIME - elapsed) / 60
                 logger.info(f"Still waiting for sensors... {remaining:.0f} minutes remaining")
 
@@ -1010,6 +1034,7 @@ class UpDownGame:
         void_break_start = time.time()
         next_shock_time = void_break_start + random.uniform(VOID_SHOCK_INTERVAL_MIN, VOID_SHOCK_INTERVAL_MAX)
         shock_count = 0
+        last_progress_bucket = 0
 
         while time.time() - void_break_start < VOID_BREAK_DURATION:
             current_time = time.time()
@@ -1040,8 +1065,10 @@ class UpDownGame:
                 await self.end_game()
                 return
 
-            # Log progress every 30 seconds
-            if int(elapsed) % 30 == 0 and elapsed > 0:
+            # Log progress every 30 seconds (once per 30s bucket)
+            bucket = int(elapsed) // 30
+            if bucket > last_progress_bucket:
+                last_progress_bucket = bucket
                 remaining = (VOID_BREAK_DURATION - elapsed)
                 logger.info(f"Void break: {remaining:.0f} seconds remaining")
 
@@ -1341,10 +1368,11 @@ class UpDownGame:
         # ============ NEW: Track session start ============
         self.session_start = self.start_time
         # ============ END NEW ============
+        self.start_str = f"{self.start_time:%Y-%m-%d %H:%M:%S}"  # Formatted once for reports
 
         logger.info("=" * 60)
-        logger.info(f"GAME STARTED: {self.start_time.strftime('%H:%M:%S')}")
-        logger.info(f"Deadline: {self.deadline.strftime('%H:%M:%S')}")
+        logger.info(f"GAME STARTED: {self.start_time:%H:%M:%S}")
+        logger.info(f"Deadline: {self.deadline:%H:%M:%S}")
         logger.info("=" * 60)
 
         # Initialize report file
@@ -1378,8 +1406,7 @@ class UpDownGame:
         prep_duration = play_round_starting()
 
         # Turn on ONLY strobe (all bulbs off)
-        await all_bulbs_off()
-        await strobe_control("on")
+        await asyncio.gather(all_bulbs_off(), strobe_control("on"))
 
         # Send vibration
         await send_vibration()
@@ -1937,8 +1964,7 @@ class UpDownGame:
         round_over_duration = play_round_over()
 
         # Turn off all lights
-        await all_bulbs_off()
-        await heat_control("off")
+        await asyncio.gather(all_bulbs_off(), heat_control("off"))
         self.heat_on = False
         logger.info("→ Mode: HEAT OFF / FAN OFF (regular break)")
 
@@ -1964,9 +1990,10 @@ class UpDownGame:
         Run break period
         Subject can request extension via Button 1
         """
-        # Initialize button state for this break
-        initial_button_1 = await read_button(BUTTON_1)
-        initial_button_2 = await read_button(BUTTON_2)
+        # Initialize button state for this break (from the button poller cache)
+        initial_button_1, initial_button_2 = await asyncio.gather(
+            get_button_count(BUTTON_1), get_button_count(BUTTON_2)
+        )
         if initial_button_1 is not None:
             self._last_button_1_value = initial_button_1
         if initial_button_2 is not None:
@@ -1982,6 +2009,7 @@ class UpDownGame:
                     logger.info("Extension ended, exiting break loop")
                     return
 
+                await asyncio.sleep(BUTTON_CHECK_INTERVAL)
                 continue
 
             # Normal break logic
@@ -1997,13 +2025,13 @@ class UpDownGame:
                 await self.end_game()
                 break
 
-            # Check Button 1 for extension request
-            current_button_1 = await read_button(BUTTON_1)
+            # Check Button 1 for extension request (poller cache - no per-tick HTTP)
+            current_button_1 = await get_button_count(BUTTON_1)
 
             if current_button_1 is not None and self._last_button_1_value is not None:
                 # Detect rising edge (button press)
                 if current_button_1 > self._last_button_1_value:
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     time_since_last_request = current_time - self.last_extension_request_time
 
                     # Check if cooldown period has passed
@@ -2012,7 +2040,7 @@ class UpDownGame:
                     else:
                         # Still in cooldown
                         remaining = EXTENSION_REQUEST_COOLDOWN - time_since_last_request
-                        logger.debug(f"Extension request ignored - cooldown ({remaining:.1f}s remaining)")
+                        logger.debug("Extension request ignored - cooldown (%.1fs remaining)", remaining)
 
                 # Update last button value
                 self._last_button_1_value = current_button_1
@@ -2026,7 +2054,7 @@ class UpDownGame:
         logger.info("=" * 60)
 
         self.total_extension_requests += 1
-        self.last_extension_request_time = time.time()
+        self.last_extension_request_time = time.monotonic()
 
         # CHECK 1: Is subject qualified?
         if not self.extension_qualified:
@@ -2061,71 +2089,99 @@ class UpDownGame:
         logger.info("Press any button to end extension")
 
         self.extension_active = True
-        self.extension_start_time = time.time()
+        self.extension_start_ns = time.monotonic_ns()
+        self._last_logged_minute = 0
         self.extension_fan_triggered = False
 
         # Randomize fan trigger time
-        self.extension_fan_trigger_time = self.extension_start_time + random.randint(
+        self.extension_fan_trigger_ns = random.randint(
             EXTENSION_FAN_ACTIVATION_MIN,
             EXTENSION_FAN_ACTIVATION_MAX
-        )
-        fan_trigger_minutes = (self.extension_fan_trigger_time - self.extension_start_time) / 60
+        ) * 1_000_000_000
+        fan_trigger_minutes = self.extension_fan_trigger_ns / 60_000_000_000
         logger.info(f"Fan will activate after {fan_trigger_minutes:.1f} minutes")
 
+        # Fan fires from a one-shot timer instead of a per-tick check
+        self._fan_timer = asyncio.get_running_loop().call_later(
+            (self.extension_start_ns + self.extension_fan_trigger_ns - time.monotonic_ns()) / 1e9,
+            self._schedule_extension_fan
+        )
+
+        # Progress logging runs off the tick path
+        self._extension_log_task = asyncio.create_task(self._log_progress_loop())
+
         # Reset button states
-        self._last_button_1_value = await read_button(BUTTON_1)
-        self._last_button_2_value = await read_button(BUTTON_2)
+        self._last_button_1_value, self._last_button_2_value = await asyncio.gather(
+            get_button_count(BUTTON_1), get_button_count(BUTTON_2)
+        )
 
     async def run_extension(self):
         """Run extension period"""
-        current_time = time.time()
-        extension_elapsed = current_time - self.extension_start_time
+        elapsed_ns = time.monotonic_ns() - self.extension_start_ns
 
         # Check if 4-hour timeout reached
-        if extension_elapsed >= TOTAL_EXTENSION_TIME_ALLOWED - self.total_extension_time_used:
+        if elapsed_ns >= (TOTAL_EXTENSION_TIME_ALLOWED - self.total_extension_time_used) * 1_000_000_000:
             logger.warning("⚠️  Extension 4-hour limit reached - ending extension")
             await self.end_extension(reason="timeout")
             return
 
-        # Check if fan activation time reached
-        if not self.extension_fan_triggered and current_time >= self.extension_fan_trigger_time:
-            logger.info("⚠️  Extension fan activation time - HEAT OFF / FAN ON")
-            await set_heat_fan_state(heat_on=False)
-            self.heat_on = False
-            self.extension_fan_triggered = True
-
-        # Check for button press to end extension
-        current_button_1 = await read_button(BUTTON_1)
-        current_button_2 = await read_button(BUTTON_2)
-
-        button_pressed = False
-
-        # Check Button 1
-        if current_button_1 is not None and self._last_button_1_value is not None:
-            if current_button_1 > self._last_button_1_value:
-                button_pressed = True
-                logger.info("Button 1 pressed - ending extension")
-            self._last_button_1_value = current_button_1
-
-        # Check Button 2
-        if current_button_2 is not None and self._last_button_2_value is not None:
-            if current_button_2 > self._last_button_2_value:
-                button_pressed = True
-                logger.info("Button 2 pressed - ending extension")
-            self._last_button_2_value = current_button_2
-
-        if button_pressed:
+        # Check for button press to end extension (cached by the button poller)
+        current_button_1, current_button_2 = await asyncio.gather(
+            get_button_count(BUTTON_1), get_button_count(BUTTON_2)
+        )
+
+        last_1, last_2 = self._last_button_1_value, self._last_button_2_value
+        pressed_1 = button_edge(current_button_1, last_1)
+        pressed_2 = button_edge(current_button_2, last_2)
+        self._last_button_1_value = current_button_1 if current_button_1 is not None else last_1
+        self._last_button_2_value = current_button_2 if current_button_2 is not None else last_2
+
+        if pressed_1 or pressed_2:
+            logger.info(f"Button {1 if pressed_1 else 2} pressed - ending extension")
             await self.end_extension(reason="button")
 
-        # Log progress every minute
-        if int(extension_elapsed) % 60 == 0 and extension_elapsed > 0:
-            logger.info(f"Extension active: {extension_elapsed / 60:.1f} minutes")
+    def _schedule_extension_fan(self):
+        """call_later callback - start the fan trigger task"""
+        self._fan_timer = None
+        if self.extension_active:
+            self._fan_task = asyncio.create_task(self._trigger_extension_fan())
+
+    async def _trigger_extension_fan(self):
+        """Extension fan activation time reached"""
+        logger.info("⚠️  Extension fan activation time - HEAT OFF / FAN ON")
+        self.extension_fan_triggered = True
+        await set_heat_fan_state(heat_on=False)
+        self.heat_on = False
+
+    async def _log_progress_loop(self):
+        """Log extension progress on each whole-minute boundary"""
+        while self.extension_active:
+            elapsed_ns = time.monotonic_ns() - self.extension_start_ns
+            minutes = elapsed_ns // 60_000_000_000
+
+            if minutes > self._last_logged_minute:
+                self._last_logged_minute = minutes
+                logger.info(f"Extension active: {minutes} minutes")
 
-        await asyncio.sleep(0.1)
+            # Sleep to the next minute boundary
+            await asyncio.sleep(((minutes + 1) * 60_000_000_000 - elapsed_ns) / 1e9)
 
     async def end_extension(self, reason: str = "button"):
         """End extension period"""
-        extension_duration = time.time() - self.extension_start_time
+        extension_duration = (time.monotonic_ns() - self.extension_start_ns) / 1e9
+
+        # Cancel pending fan trigger
+        if self._fan_timer:
+            self._fan_timer.cancel()
+            self._fan_timer = None
+        if self._fan_task and not self._fan_task.done():
+            await self._fan_task  # Let an in-flight switch finish before heat is restored
+        self._fan_task = None
+
+        # Stop progress logging
+        if self._extension_log_task:
+            self._extension_log_task.cancel()
+            self._extension_log_task = None
 
         # ============ NEW: Track actual extension time ============
         self.total_extension_time_actual += extension_duration
@@ -2134,7 +2190,7 @@ class UpDownGame:
         # Track for report
         self.last_break_extension_duration = extension_duration
         if self.extension_fan_triggered:
-            self.last_break_extension_fan_time = (self.extension_fan_trigger_time - self.extension_start_time)
+            self.last_break_extension_fan_time = self.extension_fan_trigger_ns / 1e9
 
         logger.info("=" * 60)
         logger.info(f"EXTENSION ENDED ({reason.upper()})")
@@ -2264,15 +2320,9 @@ class UpDownGame:
                 await emergency_shutdown()
                 return
 
-            # Waiting for game start
-            if not self.game_started:
-                # Check button press to start
-                pressed, self.last_button_1_value = await check_button_press(
-                    BUTTON_1, self.last_button_1_value
-                )
-                if pressed:
-                    await self.start_game()
-                return
+            handler = self._state_handlers.get(self.state)
+            if handler:
+                await handler(delta_time)
 
             # Game is running - state machine handles the rest
 
@@ -2280,23 +2330,42 @@ class UpDownGame:
             logger.critical(f"Critical error in game update: {e}", exc_info=True)
             self.critical_error = True
 
+    async def _update_waiting(self, delta_time: float):
+        """Waiting for game start - check button press to start"""
+        if self.game_started:
+            return
+
+        pressed, self.last_button_1_value = await check_button_press(
+            BUTTON_1, self.last_button_1_value
+        )
+        if pressed:
+            await self.start_game()
+
 
 # ============================================================================
 # GAME LOOP
 # ============================================================================
 
 async def game_loop(game: UpDownGame):
-    """Main game loop"""
-    last_time = time.time()
+    """Main game loop (deadline scheduled so work time doesn't add drift)"""
+    period = 0.1  # 10 Hz - buttons and bulbs need nothing faster
+    last_time = time.monotonic()
+    next_tick = last_time
 
     while game.is_running:
         try:
-            current_time = time.time()
+            current_time = time.monotonic()
             delta_time = current_time - last_time
             last_time = current_time
 
             await game.update(delta_time)
-            await asyncio.sleep(1 / 60)  # 60 FPS
+
+            next_tick += period
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()  # Behind schedule - resync
 
         except Exception as e:
             logger.critical(f"Critical error in game loop: {e}", exc_info=True)
@@ -5,8 +5,10 @@ Robust hardware control with automatic retry and continuous monitoring
 import asyncio
 import aiohttp
 import random
+import time
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional
 from config import *
 
 logger = logging.getLogger(__name__)
@@ -26,9 +28,17 @@ class HardwareState:
         self.button_2_online = True
         self.pishock_online = True
 
+        # Cached button counts (refreshed by the button poller)
+        self.button_1_count: Optional[int] = None
+        self.button_2_count: Optional[int] = None
+        self.button_last_update = 0.0
+        self.button_press_events = {}  # button_id -> asyncio.Event set by the poller on a press
+        self.button_press_queues = []  # Subscriber queues, each gets the button_id of every press
+
         # Continuous monitoring
         self.monitoring_active = False
         self.monitor_task = None
+        self.button_poller_task = None
 
 hardware_state = HardwareState()
 
@@ -36,19 +46,87 @@ hardware_state = HardwareState()
 # SHELLY DEVICE CONTROL
 # ============================================================================
 
+# Precomputed request URLs (fixed device set)
+_URL = {
+    (device_id, endpoint, command): f"http://{BASE_IP}{device_id}/{endpoint}/0?turn={command}"
+    for device_id in (BULB_1, BULB_2, STROBE, FAN, HEAT, PLUG)
+    for endpoint in ("light", "relay")
+    for command in ("on", "off")
+}
+_BUTTON_URL = {button_id: f"http://{BASE_IP}{button_id}/input/0" for button_id in (BUTTON_1, BUTTON_2)}
+
+# Shared per-attempt timeout (built once, not per request)
+_LAN_TIMEOUT = aiohttp.ClientTimeout(total=NETWORK_REQUEST_TIMEOUT, connect=NETWORK_CONNECT_TIMEOUT)
+
+# Shared keep-alive session for all Shelly requests
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP = None
+
+def _release_foreign_session():
+    """Close a session left over from another event loop instead of orphaning it"""
+    session, loop = _SESSION, _SESSION_LOOP
+    if session is None or session.closed:
+        return
+
+    if loop is not None and loop.is_running():
+        # Owner loop still alive (another thread) - close it there
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+
+    # Owner loop is gone - nothing left to await on, drop its connections directly
+    try:
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            connector._close()
+    except Exception as e:
+        logger.debug("Stale HTTP session cleanup failed: %s", e)
+
+def _get_session() -> aiohttp.ClientSession:
+    """Get the shared session (recreated if closed or on a different event loop)"""
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        _release_foreign_session()
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+        )
+        _SESSION_LOOP = loop
+    return _SESSION
+
+async def close_session():
+    """Close the shared session - call during cleanup"""
+    global _SESSION, _SESSION_LOOP
+    if _SESSION is not None and not _SESSION.closed:
+        if _SESSION_LOOP is asyncio.get_running_loop():
+            await _SESSION.close()
+        else:
+            _release_foreign_session()
+    _SESSION = None
+    _SESSION_LOOP = None
+
 async def shelly_control(device_id: int, command: str, endpoint: str = "light") -> bool:
-    """Control Shelly device with retry"""
-    url = f"http://{BASE_IP}{device_id}/{endpoint}/0?turn={command}"
+    """Control Shelly device with retry (bounded by NETWORK_TOTAL_TIMEOUT)"""
+    url = _URL.get((device_id, endpoint, command))
+    if url is None:
+        url = f"http://{BASE_IP}{device_id}/{endpoint}/0?turn={command}"
 
+    try:
+        return await asyncio.wait_for(_shelly_request(url, device_id), NETWORK_TOTAL_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.debug("Device %d timed out after %.1fs", device_id, NETWORK_TOTAL_TIMEOUT)
+        return False
+
+async def _shelly_request(url: str, device_id: int) -> bool:
+    """Shelly GET with per-attempt timeout and retries"""
     for attempt in range(NETWORK_MAX_RETRIES):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        return True
+            async with _get_session().get(url, timeout=_LAN_TIMEOUT) as response:
+                if response.status == 200:
+                    return True
         except Exception as e:
             if attempt == NETWORK_MAX_RETRIES - 1:
-                logger.debug(f"Device {device_id} failed: {e}")
+                logger.debug("Device %d failed: %s", device_id, e)
 
         if attempt < NETWORK_MAX_RETRIES - 1:
             await asyncio.sleep(NETWORK_RETRY_DELAY)
@@ -120,12 +198,10 @@ async def set_heat_fan_state(heat_on: bool):
     If heat OFF → fan ON
     """
     if heat_on:
-        await heat_control("on")
-        await fan_control("off")
+        await asyncio.gather(heat_control("on"), fan_control("off"))
         logger.info("→ Mode: HEAT ON / FAN OFF")
     else:
-        await heat_control("off")
-        await fan_control("on")
+        await asyncio.gather(heat_control("off"), fan_control("on"))
         logger.info("→ Mode: HEAT OFF / FAN ON")
 
 # ============================================================================
@@ -138,36 +214,129 @@ async def plug_control(state: str) -> bool:
     hardware_state.plug_online = success
     return success
 
+# ============================================================================
+# COMBINED OUTPUT CONTROL
+# ============================================================================
+
+_OUTPUT_CONTROLS = {
+    'bulb_1': bulb_1_control,
+    'bulb_2': bulb_2_control,
+    'strobe': strobe_control,
+    'fan': fan_control,
+    'heat': heat_control,
+    'plug': plug_control,
+}
+
+async def set_outputs(**state: bool) -> Dict[str, bool]:
+    """
+    Switch several outputs in one concurrent round-trip
+    e.g. set_outputs(bulb_1=True, bulb_2=True, strobe=False) -> {name: success}
+    """
+    unknown = set(state) - set(_OUTPUT_CONTROLS)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {', '.join(sorted(unknown))}")
+
+    names = list(state)
+    results = await asyncio.gather(
+        *(_OUTPUT_CONTROLS[name]("on" if state[name] else "off") for name in names),
+        return_exceptions=True
+    )
+    return {name: result is True for name, result in zip(names, results)}
+
 # ============================================================================
 # BUTTON CONTROLS
 # ============================================================================
 
 async def read_button(button_id: int) -> Optional[int]:
-    """Read button event count"""
-    url = f"http://{BASE_IP}{button_id}/input/0"
+    """Read button event count (bounded by NETWORK_TOTAL_TIMEOUT)"""
+    url = _BUTTON_URL.get(button_id) or f"http://{BASE_IP}{button_id}/input/0"
+
+    try:
+        return await asyncio.wait_for(_button_request(url, button_id), NETWORK_TOTAL_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.debug("Button %d read timed out after %.1fs", button_id, NETWORK_TOTAL_TIMEOUT)
+        return None
 
+async def _button_request(url: str, button_id: int) -> Optional[int]:
+    """Button GET with per-attempt timeout and retries"""
     for attempt in range(NETWORK_MAX_RETRIES):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data['inputs'][0]['event_cnt']
+            async with _get_session().get(url, timeout=_LAN_TIMEOUT) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return data['inputs'][0]['event_cnt']
         except Exception as e:
             if attempt == NETWORK_MAX_RETRIES - 1:
-                logger.debug(f"Button {button_id} read failed: {e}")
+                logger.debug("Button %d read failed: %s", button_id, e)
 
         if attempt < NETWORK_MAX_RETRIES - 1:
             await asyncio.sleep(NETWORK_RETRY_DELAY)
 
     return None
 
+async def read_buttons(button_ids=(BUTTON_1, BUTTON_2)) -> Dict[int, Optional[int]]:
+    """Read several button event counts concurrently - {button_id: count or None}"""
+    values = await asyncio.gather(*(read_button(button_id) for button_id in button_ids))
+    return dict(zip(button_ids, values))
+
+def button_edge(current: Optional[int], last: Optional[int]) -> bool:
+    """True if the button event count rose since the last reading"""
+    return current is not None and last is not None and current > last
+
+async def get_button_count(button_id: int) -> Optional[int]:
+    """
+    Get latest button event count
+    Served from the button poller cache when it is running, otherwise read directly
+    None while the poller's last read of the button failed (the cached count is kept for edges)
+    """
+    poller = hardware_state.button_poller_task
+    if poller is not None and not poller.done() and hardware_state.button_last_update:
+        if button_id == BUTTON_1:
+            return hardware_state.button_1_count if hardware_state.button_1_online else None
+        if button_id == BUTTON_2:
+            return hardware_state.button_2_count if hardware_state.button_2_online else None
+
+    return await read_button(button_id)
+
+def _button_press_event(button_id: int) -> asyncio.Event:
+    event = hardware_state.button_press_events.get(button_id)
+    if event is None:
+        event = hardware_state.button_press_events[button_id] = asyncio.Event()
+    return event
+
+async def wait_for_button_press(button_id: int):
+    """
+    Wait for the next press of a button
+    Woken by the button poller (started here if needed) instead of polling per caller
+    """
+    start_button_poller()
+    event = _button_press_event(button_id)
+    event.clear()
+    await event.wait()
+
+def subscribe_button_presses() -> asyncio.Queue:
+    """
+    Get a queue that receives the button id of every press (either button)
+    Starts the button poller if needed; pair with unsubscribe_button_presses()
+    """
+    queue = asyncio.Queue()
+    hardware_state.button_press_queues.append(queue)
+    start_button_poller()
+    return queue
+
+def unsubscribe_button_presses(queue: asyncio.Queue):
+    """Stop delivering presses to a queue from subscribe_button_presses()"""
+    try:
+        hardware_state.button_press_queues.remove(queue)
+    except ValueError:
+        pass
+
 async def check_button_press(button_id: int, last_value: Optional[int]) -> tuple[bool, Optional[int]]:
     """
     Check if button pressed since last check
     Returns: (pressed, new_value)
     """
-    current_value = await read_button(button_id)
+    current_value = await get_button_count(button_id)
 
     if current_value is None:
         if button_id == BUTTON_1:
@@ -181,10 +350,7 @@ async def check_button_press(button_id: int, last_value: Optional[int]) -> tuple
     else:
         hardware_state.button_2_online = True
 
-    if last_value is None:
-        return False, current_value
-
-    if current_value > last_value:
+    if button_edge(current_value, last_value):
         logger.info(f"Button {button_id} pressed")
         return True, current_value
 
@@ -194,6 +360,19 @@ async def check_button_press(button_id: int, last_value: Optional[int]) -> tuple
 # PISHOCK CONTROL - SIMPLIFIED (SINGLE EMITTER)
 # ============================================================================
 
+_pishock_session = None
+_pishock_session_lock = threading.Lock()
+
+def _get_pishock_session():
+    """Get the shared PiShock HTTPS session (created on first use, keeps TLS alive)"""
+    global _pishock_session
+    with _pishock_session_lock:
+        if _pishock_session is None:
+            import requests
+            _pishock_session = requests.Session()
+            _pishock_session.headers.update({"Content-type": "application/json"})
+        return _pishock_session
+
 async def send_pishock(mode: str = "shock", intensity: int = 30, duration: int = 1):
     """
     Send PiShock command (shock or vibrate)
@@ -218,14 +397,7 @@ async def send_pishock(mode: str = "shock", intensity: int = 30, duration: int =
 
         # Run requests.post in thread pool to avoid blocking
         def _send_request():
-            import requests
-            import json
-            response = requests.post(
-                api_url,
-                data=json.dumps(api_data),
-                headers={"Content-type": "application/json"},
-                timeout=5
-            )
+            response = _get_pishock_session().post(api_url, json=api_data, timeout=5)
             return response.status_code, response.text
 
         # Execute in thread pool
@@ -233,7 +405,7 @@ async def send_pishock(mode: str = "shock", intensity: int = 30, duration: int =
 
         if status_code == 200:
             logger.info(f"✓ PiShock {mode} sent successfully (Status: {status_code})")  # ← ADD THIS
-            logger.debug(f"  Response: {response_text}")
+            logger.debug("  Response: %s", response_text)
         else:
             logger.warning(f"⚠️ PiShock returned status {status_code}: {response_text}")
 
@@ -247,6 +419,21 @@ async def send_vibration(intensity: int = 30, duration: int = 1):
 # CONTINUOUS CONNECTION MONITORING
 # ============================================================================
 
+async def _button_online(button_id: int) -> bool:
+    """Reconnection probe for a button"""
+    return await read_button(button_id) is not None
+
+# (state flag prefix, display name, probe) - probes must not switch anything ON
+_MONITOR_PROBES = (
+    ("bulb_1", "Bulb 1", lambda: shelly_control(BULB_1, "off", "light")),
+    ("bulb_2", "Bulb 2", lambda: shelly_control(BULB_2, "off", "light")),
+    ("strobe", "Strobe", lambda: shelly_control(STROBE, "off", "relay")),
+    ("button_1", "Button 1", lambda: _button_online(BUTTON_1)),
+    ("button_2", "Button 2", lambda: _button_online(BUTTON_2)),
+    ("fan", "Fan", lambda: shelly_control(FAN, "off", "relay")),
+    ("plug", "Plug", lambda: shelly_control(PLUG, "off", "relay")),
+)
+
 async def monitor_hardware_connections():
     """
     Background task that continuously monitors and retries failed connections
@@ -255,66 +442,24 @@ async def monitor_hardware_connections():
     logger.info("Hardware connection monitoring started")
 
     while hardware_state.monitoring_active:
+        hs = hardware_state
         try:
-            # Check bulbs
-            if not hardware_state.bulb_1_online:
-                logger.debug("Retrying Bulb 1 connection...")
-                result = await shelly_control(BULB_1, "off", "light")
-                if result:
-                    hardware_state.bulb_1_online = True
-                    logger.info("✓ Bulb 1 reconnected")
-
-            if not hardware_state.bulb_2_online:
-                logger.debug("Retrying Bulb 2 connection...")
-                result = await shelly_control(BULB_2, "off", "light")
-                if result:
-                    hardware_state.bulb_2_online = True
-                    logger.info("✓ Bulb 2 reconnected")
-
-            if not hardware_state.strobe_online:
-                logger.debug("Retrying Strobe connection...")
-                result = await shelly_control(STROBE, "off", "light")
-                if result:
-                    hardware_state.strobe_online = True
-                    logger.info("✓ Strobe reconnected")
-
-            # Check buttons
-            if not hardware_state.button_1_online:
-                logger.debug("Retrying Button 1 connection...")
-                value = await read_button(BUTTON_1)
-                if value is not None:
-                    hardware_state.button_1_online = True
-                    logger.info("✓ Button 1 reconnected")
-
-            if not hardware_state.button_2_online:
-                logger.debug("Retrying Button 2 connection...")
-                value = await read_button(BUTTON_2)
-                if value is not None:
-                    hardware_state.button_2_online = True
-                    logger.info("✓ Button 2 reconnected")
-
-            # Check fan
-            if not hardware_state.fan_online:
-                logger.debug("Retrying Fan connection...")
-                result = await shelly_control(FAN, "off", "relay")
-                if result:
-                    hardware_state.fan_online = True
-                    logger.info("✓ Fan reconnected")
-
-            # Check plug
-            if not hardware_state.plug_online:
-                logger.debug("Retrying Plug connection...")
-                result = await shelly_control(PLUG, "off", "relay")
-                if result:
-                    hardware_state.plug_online = True
-                    logger.info("✓ Plug reconnected")
-
-            # Check PiShock with minimal test
-            if not hardware_state.pishock_online:
-                logger.debug("Retrying PiShock connection...")
-                # Don't actually send shock during monitoring, just mark as online
-                # Will be tested during actual use
-                hardware_state.pishock_online = True
+            # Probe every offline device together
+            tasks = [(prefix, name, probe()) for prefix, name, probe in _MONITOR_PROBES
+                     if not getattr(hs, f"{prefix}_online")]
+
+            if tasks:
+                logger.debug("Retrying %d device connection(s)...", len(tasks))
+                results = await asyncio.gather(*(t[2] for t in tasks), return_exceptions=True)
+                for (prefix, name, _), ok in zip(tasks, results):
+                    if ok is True:
+                        setattr(hs, f"{prefix}_online", True)
+                        logger.info(f"✓ {name} reconnected")
+
+            # Don't actually send shock during monitoring, just mark as online
+            # Will be tested during actual use
+            if not hs.pishock_online:
+                hs.pishock_online = True
 
         except Exception as e:
             logger.error(f"Error in hardware monitoring: {e}")
@@ -323,11 +468,67 @@ async def monitor_hardware_connections():
 
     logger.info("Hardware connection monitoring stopped")
 
+async def _button_poller():
+    """
+    Background task that keeps the cached button counts fresh
+    Game logic reads the cache instead of issuing its own HTTP requests
+    """
+    while True:
+        try:
+            values = await read_buttons()
+            value_1 = values[BUTTON_1]
+            value_2 = values[BUTTON_2]
+
+            pressed = []
+            if button_edge(value_1, hardware_state.button_1_count):
+                pressed.append(BUTTON_1)
+            if button_edge(value_2, hardware_state.button_2_count):
+                pressed.append(BUTTON_2)
+
+            for button_id in pressed:
+                event = hardware_state.button_press_events.get(button_id)
+                if event is not None:
+                    event.set()
+                for queue in hardware_state.button_press_queues:
+                    queue.put_nowait(button_id)
+
+            # Keep the last good count across failed reads so the next press still registers
+            if value_1 is not None:
+                hardware_state.button_1_count = value_1
+            if value_2 is not None:
+                hardware_state.button_2_count = value_2
+            hardware_state.button_1_online = value_1 is not None
+            hardware_state.button_2_online = value_2 is not None
+            hardware_state.button_last_update = time.monotonic()
+
+        except Exception as e:
+            logger.error(f"Error in button poller: {e}")
+
+        await asyncio.sleep(BUTTON_POLL_INTERVAL)
+
+def start_button_poller():
+    """Start the button poller background task"""
+    poller = hardware_state.button_poller_task
+    if poller is None or poller.done():
+        hardware_state.button_last_update = 0.0
+        hardware_state.button_1_count = None
+        hardware_state.button_2_count = None
+        hardware_state.button_poller_task = asyncio.create_task(_button_poller())
+        logger.info("Started button poller")
+
+def stop_button_poller():
+    """Stop the button poller background task"""
+    if hardware_state.button_poller_task:
+        hardware_state.button_poller_task.cancel()
+        hardware_state.button_poller_task = None
+        logger.info("Stopped button poller")
+
 def start_hardware_monitoring():
     """Start the hardware monitoring background task"""
     if not hardware_state.monitoring_active:
         hardware_state.monitoring_active = True
         hardware_state.monitor_task = asyncio.create_task(monitor_hardware_connections())
+        start_button_poller()
         logger.info("Started hardware monitoring")
 
 def stop_hardware_monitoring():
@@ -336,6 +537,7 @@ def stop_hardware_monitoring():
         hardware_state.monitoring_active = False
         if hardware_state.monitor_task:
             hardware_state.monitor_task.cancel()
+        stop_button_poller()
         logger.info("Stopped hardware monitoring")
 
 # ============================================================================
@@ -348,19 +550,52 @@ async def emergency_shutdown():
     """
     logger.critical("EMERGENCY SHUTDOWN")
 
+    await hold_end_state(retry_interval=5, label="Emergency shutdown")
+
+async def hold_end_state(retry_interval: float, label: str, strobe: bool = False):
+    """
+    Keep plug and bulbs (and optionally strobe) ON forever
+    Offline devices are retried every retry_interval; once all are online
+    a full re-assert only runs every END_STATE_HEALTHY_INTERVAL
+    """
+    # The monitor probes with "off" commands, which would undo the end state
+    stop_hardware_monitoring()
+
+    controls = (
+        (plug_control, "plug_online"),
+        (bulb_1_control, "bulb_1_online"),
+        (bulb_2_control, "bulb_2_online"),
+    )
+    if strobe:
+        controls += ((strobe_control, "strobe_online"),)
+    pending = controls
+
     while True:
         try:
-            await plug_control("on")
-            await all_bulbs_on()
-            await asyncio.sleep(5)
+            await asyncio.gather(*(control("on") for control, _ in pending))
+            pending = tuple(c for c in controls if not getattr(hardware_state, c[1]))
+
+            if pending:
+                await asyncio.sleep(retry_interval)
+            else:
+                await asyncio.sleep(END_STATE_HEALTHY_INTERVAL)
+                pending = controls
         except Exception as e:
-            logger.error(f"Emergency shutdown error: {e}")
+            logger.error(f"{label} error: {e}")
             await asyncio.sleep(5)
 
 # ============================================================================
 # GAME END SEQUENCE
 # ============================================================================
 
+async def countdown_logger(wait_time: float, label: str = "plug activation"):
+    """Log remaining wait time once a minute"""
+    remaining = wait_time
+    while remaining > 60:
+        await asyncio.sleep(60)
+        remaining -= 60
+        logger.info(f"  {remaining / 60:.1f} minutes until {label}...")
+
 async def game_end_sequence():
     """
     Normal game end sequence:
@@ -377,8 +612,7 @@ async def game_end_sequence():
 
     # Step 1: Turn on all bulbs AND play audio simultaneously
     try:
-        await strobe_control("on")
-        await all_bulbs_on()
+        await asyncio.gather(strobe_control("on"), all_bulbs_on())
 
         logger.info("✓ All bulbs turned ON")
     except Exception as e:
@@ -389,20 +623,15 @@ async def game_end_sequence():
     logger.info("✓ Training ended audio playing")
 
     # Step 2: Wait 3-5 minutes before plug activation
-    import random
     wait_time = random.randint(3 * 60, 5 * 60)  # 180-300 seconds
     logger.info(f"Waiting {wait_time} seconds ({wait_time / 60:.1f} minutes) before plug activation...")
 
-    # Wait in 10-second intervals
-    elapsed = 0
-    while elapsed < wait_time:
-        await asyncio.sleep(10)
-        elapsed += 10
-
-        # Log progress every minute
-        if elapsed % 60 == 0:
-            remaining = (wait_time - elapsed) / 60
-            logger.info(f"  {remaining:.1f} minutes until plug activation...")
+    # Single sleep - progress logging runs as its own task
+    logger_task = asyncio.create_task(countdown_logger(wait_time))
+    try:
+        await asyncio.sleep(wait_time)
+    finally:
+        logger_task.cancel()
 
     # Step 3: Activate plug
     logger.info("Activating plug...")
@@ -416,14 +645,7 @@ async def game_end_sequence():
     logger.info("=" * 60)
 
     # Step 4: Keep everything on indefinitely
-    while True:
-        try:
-            await plug_control("on")
-            await all_bulbs_on()
-            await asyncio.sleep(30)
-        except Exception as e:
-            logger.error(f"Game end maintenance error: {e}")
-            await asyncio.sleep(5)
+    await hold_end_state(retry_interval=30, label="Game end maintenance")
 
 async def test_all_hardware():
     """Test all hardware"""
@@ -432,69 +654,29 @@ async def test_all_hardware():
     logger.info("="*60)
 
     tests = [
-        ("Bulb 1 (DOWN)", lambda: bulb_1_control("on")),
-        ("Bulb 2 (UP)", lambda: bulb_2_control("on")),
-        ("Strobe", lambda: strobe_control("on")),
-        ("Fan", lambda: fan_control("on")),
-        ("Plug", lambda: plug_control("on")),
+        ("Bulb 1 (DOWN)", bulb_1_control),
+        ("Bulb 2 (UP)", bulb_2_control),
+        ("Strobe", strobe_control),
+        ("Fan", fan_control),
+        ("Plug", plug_control),
     ]
 
-    for name, func in tests:
-        logger.info(f"Testing {name}...")
-        result = await func()
-        logger.info(f"  {'✓' if result else '✗'}")
-        await asyncio.sleep(0.5)
-        # Turn off after test
-        device = name.split()[0].lower()
-        if device == "bulb":
-            if "1" in name:
-                await bulb_1_control("off")
-            elif "2" in name:
-                await bulb_2_control("off")
-        elif device == "strobe":
-            await strobe_control("off")
-        elif device == "fan":
-            await fan_control("off")
-        elif device == "plug":
-            await plug_control("off")
-
-    logger.info("Testing Button 1...")
-    value = await read_button(BUTTON_1)
-    logger.info(f"  {'✓' if value is not None else '✗'} (count: {value})")
-
-    logger.info("Testing Button 2...")
-    value = await read_button(BUTTON_2)
-    logger.info(f"  {'✓' if value is not None else '✗'} (count: {value})")
+    logger.info("Testing outputs...")
+    results = await asyncio.gather(*(control("on") for _, control in tests))
+    for (name, _), result in zip(tests, results):
+        logger.info(f"  {name} {'✓' if result else '✗'}")
+    await asyncio.sleep(0.5)
+    await asyncio.gather(*(control("off") for _, control in tests))
+
+    logger.info("Testing Buttons...")
+    values = await read_buttons()
+    value_1 = values[BUTTON_1]
+    value_2 = values[BUTTON_2]
+    logger.info(f"  Button 1 {'✓' if value_1 is not None else '✗'} (count: {value_1})")
+    logger.info(f"  Button 2 {'✓' if value_2 is not None else '✗'} (count: {value_2})")
 
     logger.info("Testing PiShock (vibration)...")
     result = await send_vibration()
     logger.info(f"  {'✓' if result else '✗'}")
 
     logger.info("="*60)
-
-
-# ============================================================================
-# HARDWARE MONITORING (Continuous reconnection)
-# ============================================================================
-
-async def hardware_monitor():
-    """
-    Monitor hardware connections and attempt reconnection
-    Runs continuously throughout the game
-    """
-    logger.info("Hardware monitoring started")
-
-    check_interval = HARDWARE_MONITOR_INTERVAL  # From config (default 10 seconds)
-
-    while True:
-        try:
-            # Just sleep - hardware already auto-reconnects via Govee API
-            # This task mainly exists to match the original architecture
-            await asyncio.sleep(check_interval)
-
-        except asyncio.CancelledError:
-            logger.info("Hardware monitoring stopped")
-            break
-        except Exception as e:
-            logger.error(f"Hardware monitor error: {e}")
-            await asyncio.sleep(5)
\ No newline at end of file
@@ -3,9 +3,12 @@ Holding Training Game - FIXED VERSION
 """
 
 import asyncio
+import os
 import random
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
@@ -17,12 +20,10 @@ from hardware import (
     all_bulbs_on, all_bulbs_off,
     read_button, check_button_press,
     send_vibration,
-    emergency_shutdown
+    emergency_shutdown, countdown_logger, hold_end_state
 )
-from audio import start_white_noise, stop_white_noise
+from audio import start_white_noise, stop_white_noise, play_audio_from_folder
 
-import sys
-sys.path.append('.')
 from main_wit import SensorDataQueue, SensorState
 
 logger = logging.getLogger(__name__)
@@ -30,10 +31,67 @@ logger = logging.getLogger(__name__)
 ANGLE_THRESHOLD = 10
 REMINDER_INTERVAL_MIN = 60
 REMINDER_INTERVAL_MAX = 120
+_REMINDER_RING_SIZE = 1024  # Power of two - indexed with a mask
 REMINDER_DURATION = 3
 HOLD_CONFIRMATION_DURATION = 5
+HOLD_LOG_INTERVAL = 30
+SENSOR_POLL_INTERVAL = 0.1  # Spacing between updates - level changes are human-speed
 SENSOR_PATIENCE_TIME = 1 * 3600
 
+_UNSET = object()  # No per-tick angle cached
+
+# Report divider lines
+_DIV_HEAVY = "=" * 100
+_DIV_LIGHT = "─" * 100
+_HDR = _DIV_HEAVY + "\n"
+
+# Single worker keeps report writes in submission order, off the event loop
+_report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="holding_report")
+
+
+# ============================================================================
+# REPORT FILE I/O (runs on _report_executor)
+# ============================================================================
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    """Report block rendered on the event loop; the writer thread only sees bytes"""
+    __slots__ = ("body",)
+    body: bytes
+
+    @classmethod
+    def render(cls, text: str) -> "ReportSnapshot":
+        return cls(text.encode('utf-8'))
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _open_report_file(path: str, header: ReportSnapshot) -> int:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    _write_all(fd, header.body)
+    return fd
+
+
+def _append_report_file(fd: int, snapshot: ReportSnapshot):
+    try:
+        _write_all(fd, snapshot.body)
+    except OSError as e:
+        logger.error(f"Failed to write report: {e}")
+
+
+def _finish_report_file(fd: int, snapshot: Optional[ReportSnapshot] = None):
+    try:
+        if snapshot is not None:
+            _write_all(fd, snapshot.body)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 class HoldingState(Enum):
     WAITING = "waiting"
     NOT_HOLDING = "not_holding"
@@ -50,23 +108,40 @@ class HoldingGame:
 
         self.start_time: Optional[datetime] = None
         self.deadline: Optional[datetime] = None
+        self._deadline_mono: Optional[float] = None  # Deadline on the time.monotonic() clock for tick checks
+        self.start_str: Optional[str] = None  # start_time pre-formatted for reports
         self.training_goal = random.randint(HOLDING_TRAINING_TIME_MIN, HOLDING_TRAINING_TIME_MAX)
         self.accumulated_hold_time = 0.0
-        self.current_hold_start = 0.0
+        self.current_hold_start = 0.0  # time.monotonic() - durations only
+        self.current_hold_start_wall: Optional[datetime] = None  # Wall clock, for the report
+        self._next_hold_log_time = 0.0  # Next 30s progress log while HOLDING
+        self._flash_task: Optional[asyncio.Task] = None  # Hold confirmation bulb flash
 
         self.currently_holding = False
-        self.next_reminder_time = 0
+        self._reminder_handle: Optional[asyncio.TimerHandle] = None  # Next reminder while NOT_HOLDING
+        self._reminder_task: Optional[asyncio.Task] = None  # Reminder flash in progress
+        # Reminder intervals drawn once per session, consumed round-robin
+        self._reminder_intervals = random.choices(
+            range(REMINDER_INTERVAL_MIN, REMINDER_INTERVAL_MAX + 1), k=_REMINDER_RING_SIZE
+        )
+        self._reminder_ix = 0
         self.sensor_loss_start = None
         self.sensor_lost = False
         self.critical_error = False
+        self._tick_now = 0.0  # time.monotonic() cached once per update tick
+        self._tick_angle = _UNSET  # Board angle cached once per update tick
 
         self.session_start = None
         self.session_end = None
 
         self.report_file = None
-        self._create_report()
+        self._report_fd: Optional[int] = None  # Raw report fd (one os.write per block, fsync + close in end_game)
         self.hold_attempts = []  # List of all hold attempts
         self.attempt_number = 0
+        # Running attempt stats (updated per attempt, read by the final report)
+        self._sum_duration = 0.0
+        self._longest_attempt: Optional[dict] = None
+        self._shortest_attempt: Optional[dict] = None
 
         logger.info("=" * 60)
         logger.info("HOLDING TRAINING GAME")
@@ -74,20 +149,24 @@ class HoldingGame:
         logger.info(f"Angle threshold: ±{ANGLE_THRESHOLD} degrees")
         logger.info("=" * 60)
 
-    def _create_report(self):
-        """Create report file with header"""
+    async def _create_report(self):
+        """Create report file with header (handle stays open for the session)"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.report_file = f"holding_report_{timestamp}.txt"
 
-            with open(self.report_file, 'w') as f:
-                f.write("=" * 100 + "\n")
-                f.write("HOLDING TRAINING GAME - SESSION REPORT\n")
-                f.write("=" * 100 + "\n")
-                f.write(f"Report Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Training Goal: {self.training_goal / 60:.1f} minutes ({self.training_goal:.0f} seconds)\n")
-                f.write(f"Angle Threshold: ANY negative OR 0° to +{ANGLE_THRESHOLD}°\n")
-                f.write("=" * 100 + "\n\n")
+            header = (
+                f"{_HDR}"
+                "HOLDING TRAINING GAME - SESSION REPORT\n"
+                f"{_HDR}"
+                f"Report Created: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+                f"Training Goal: {self.training_goal / 60:.1f} minutes ({self.training_goal:.0f} seconds)\n"
+                f"Angle Threshold: ANY negative OR 0° to +{ANGLE_THRESHOLD}°\n"
+                f"{_HDR}\n"
+            )
+            loop = asyncio.get_running_loop()
+            self._report_fd = await loop.run_in_executor(
+                _report_executor, _open_report_file, self.report_file, ReportSnapshot.render(header))
 
             logger.info(f"✓ Report created: {self.report_file}")
         except Exception as e:
@@ -95,7 +174,7 @@ class HoldingGame:
 
     def _log_hold_attempt(self, start_time: datetime, end_time: datetime, duration: float):
         """Log a hold attempt to report file"""
-        if not self.report_file:
+        if self._report_fd is None:
             return
 
         try:
@@ -117,138 +196,169 @@ class HoldingGame:
                 'percent_complete': percent_complete
             }
             self.hold_attempts.append(attempt_data)
-
-            # Write to file immediately
-            with open(self.report_file, 'a') as f:
-                f.write(f"\n{'─' * 100}\n")
-                f.write(f"ATTEMPT #{self.attempt_number}\n")
-                f.write(f"{'─' * 100}\n")
-                f.write(f"Started:           {start_time.strftime('%H:%M:%S')}\n")
-                f.write(f"Ended:             {end_time.strftime('%H:%M:%S')}\n")
-                f.write(f"Hold Duration:     {duration:.1f} seconds ({duration / 60:.2f} minutes)\n")
-                f.write(f"\n")
-                f.write(f"Progress After This Attempt:\n")
-                f.write(
-                    f"  Total Accumulated:  {total_accumulated:.1f} seconds ({total_accumulated / 60:.2f} minutes)\n")
-                f.write(f"  Remaining:          {remaining:.1f} seconds ({remaining / 60:.2f} minutes)\n")
-                f.write(f"  Completion:         {percent_complete:.1f}%\n")
-                f.write(f"{'─' * 100}\n")
+            self._sum_duration += duration
+            if self._longest_attempt is None or duration > self._longest_attempt['duration']:
+                self._longest_attempt = attempt_data
+            if self._shortest_attempt is None or duration < self._shortest_attempt['duration']:
+                self._shortest_attempt = attempt_data
+
+            # Write to file immediately (one write per attempt)
+            text = (
+                f"\n{_DIV_LIGHT}\n"
+                f"ATTEMPT #{self.attempt_number}\n"
+                f"{_DIV_LIGHT}\n"
+                f"Started:           {start_time:%H:%M:%S}\n"
+                f"Ended:             {end_time:%H:%M:%S}\n"
+                f"Hold Duration:     {duration:.1f} seconds ({duration / 60:.2f} minutes)\n"
+                "\n"
+                "Progress After This Attempt:\n"
+                f"  Total Accumulated:  {total_accumulated:.1f} seconds ({total_accumulated / 60:.2f} minutes)\n"
+                f"  Remaining:          {remaining:.1f} seconds ({remaining / 60:.2f} minutes)\n"
+                f"  Completion:         {percent_complete:.1f}%\n"
+                f"{_DIV_LIGHT}\n"
+            )
+            _report_executor.submit(_append_report_file, self._report_fd, ReportSnapshot.render(text))
 
         except Exception as e:
             logger.error(f"Failed to log attempt: {e}")
 
-    def generate_final_report(self):
-        """Generate comprehensive final report"""
-        if not self.report_file:
+    async def generate_final_report(self):
+        """Generate comprehensive final report, then flush and close the file"""
+        fd = self._report_fd
+        if fd is None:
             return
+        self._report_fd = None
 
+        snapshot = None
         try:
-            with open(self.report_file, 'a') as f:
-                f.write("\n\n")
-                f.write("=" * 100 + "\n")
-                f.write("FINAL SESSION SUMMARY\n")
-                f.write("=" * 100 + "\n")
-                f.write(f"Session Start:  {self.session_start.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Session End:    {self.session_end.strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-                duration = (self.session_end - self.session_start).total_seconds()
-                hours = int(duration // 3600)
-                minutes = int((duration % 3600) // 60)
-                seconds = int(duration % 60)
-                f.write(f"Total Duration: {hours}h {minutes}m {seconds}s\n")
-                f.write("\n")
-
-                # Goal and achievement
-                f.write(
-                    f"Training Goal:        {self.training_goal / 60:.1f} minutes ({self.training_goal:.0f} seconds)\n")
-                f.write(
-                    f"Total Hold Time:      {self.accumulated_hold_time / 60:.2f} minutes ({self.accumulated_hold_time:.1f} seconds)\n")
-                f.write(
-                    f"Remaining:            {self.remaining_time / 60:.2f} minutes ({self.remaining_time:.1f} seconds)\n")
-
-                completion_percent = (
-                            self.accumulated_hold_time / self.training_goal * 100) if self.training_goal > 0 else 0
-                f.write(f"Completion:           {completion_percent:.1f}%\n")
-                f.write("\n")
-
-                # Result
-                if self.remaining_time <= 0:
-                    f.write("Result: ✓ GOAL ACHIEVED\n")
-                elif self.is_deadline_reached():
-                    f.write("Result: ✗ TIME EXPIRED (deadline reached)\n")
-                else:
-                    f.write("Result: ✗ TERMINATED (early exit)\n")
-                f.write("\n")
-
-                # Time distribution
-                hold_percent = (self.accumulated_hold_time / duration * 100) if duration > 0 else 0
-                not_hold_percent = 100 - hold_percent
-                not_hold_time = duration - self.accumulated_hold_time
-
-                f.write("Time Distribution:\n")
-                f.write(f"  Time Holding:      {self.accumulated_hold_time / 60:.2f} minutes ({hold_percent:.1f}%)\n")
-                f.write(f"  Time Not Holding:  {not_hold_time / 60:.2f} minutes ({not_hold_percent:.1f}%)\n")
-                f.write("\n")
-
-                # Attempt statistics
-                f.write("=" * 100 + "\n")
-                f.write("ATTEMPT STATISTICS\n")
-                f.write("=" * 100 + "\n")
-                f.write(f"Total Attempts:       {self.attempt_number}\n")
-
-                if self.hold_attempts:
-                    durations = [a['duration'] for a in self.hold_attempts]
-                    avg_duration = sum(durations) / len(durations)
-                    longest = max(durations)
-                    shortest = min(durations)
-
-                    f.write(f"Average Hold:         {avg_duration:.1f} seconds ({avg_duration / 60:.2f} minutes)\n")
-                    f.write(f"Longest Hold:         {longest:.1f} seconds ({longest / 60:.2f} minutes)\n")
-                    f.write(f"Shortest Hold:        {shortest:.1f} seconds ({shortest / 60:.2f} minutes)\n")
-
-                    # Find longest and shortest attempts
-                    longest_attempt = max(self.hold_attempts, key=lambda x: x['duration'])
-                    shortest_attempt = min(self.hold_attempts, key=lambda x: x['duration'])
-
-                    f.write(f"\n")
-                    f.write(
-                        f"Longest attempt was #{longest_attempt['number']} at {longest_attempt['start_time'].strftime('%H:%M:%S')}\n")
-                    f.write(
-                        f"Shortest attempt was #{shortest_attempt['number']} at {shortest_attempt['start_time'].strftime('%H:%M:%S')}\n")
-                else:
-                    f.write("No hold attempts recorded.\n")
-
-                f.write("\n")
-                f.write("=" * 100 + "\n")
-                f.write("END OF REPORT\n")
-                f.write("=" * 100 + "\n")
-
-            logger.info(f"✓ Final report saved: {self.report_file}")
+            parts = [
+                "\n\n",
+                _HDR,
+                "FINAL SESSION SUMMARY\n",
+                _HDR,
+                f"Session Start:  {self.start_str}\n",
+                f"Session End:    {self.session_end:%Y-%m-%d %H:%M:%S}\n",
+            ]
+
+            duration = (self.session_end - self.session_start).total_seconds()
+            hours = int(duration // 3600)
+            minutes = int((duration % 3600) // 60)
+            seconds = int(duration % 60)
+            parts.append(f"Total Duration: {hours}h {minutes}m {seconds}s\n")
+            parts.append("\n")
+
+            # Goal and achievement
+            parts.append(
+                f"Training Goal:        {self.training_goal / 60:.1f} minutes ({self.training_goal:.0f} seconds)\n")
+            parts.append(
+                f"Total Hold Time:      {self.accumulated_hold_time / 60:.2f} minutes ({self.accumulated_hold_time:.1f} seconds)\n")
+            parts.append(
+                f"Remaining:            {self.remaining_time / 60:.2f} minutes ({self.remaining_time:.1f} seconds)\n")
+
+            completion_percent = (
+                        self.accumulated_hold_time / self.training_goal * 100) if self.training_goal > 0 else 0
+            parts.append(f"Completion:           {completion_percent:.1f}%\n")
+            parts.append("\n")
+
+            # Result
+            if self.remaining_time <= 0:
+                parts.append("Result: ✓ GOAL ACHIEVED\n")
+            elif self.is_deadline_reached():
+                parts.append("Result: ✗ TIME EXPIRED (deadline reached)\n")
+            else:
+                parts.append("Result: ✗ TERMINATED (early exit)\n")
+            parts.append("\n")
+
+            # Time distribution
+            hold_percent = (self.accumulated_hold_time / duration * 100) if duration > 0 else 0
+            not_hold_percent = 100 - hold_percent
+            not_hold_time = duration - self.accumulated_hold_time
+
+            parts.append("Time Distribution:\n")
+            parts.append(f"  Time Holding:      {self.accumulated_hold_time / 60:.2f} minutes ({hold_percent:.1f}%)\n")
+            parts.append(f"  Time Not Holding:  {not_hold_time / 60:.2f} minutes ({not_hold_percent:.1f}%)\n")
+            parts.append("\n")
+
+            # Attempt statistics
+            parts.append(_HDR)
+            parts.append("ATTEMPT STATISTICS\n")
+            parts.append(_HDR)
+            parts.append(f"Total Attempts:       {self.attempt_number}\n")
+
+            if self.hold_attempts:
+                longest_attempt = self._longest_attempt
+                shortest_attempt = self._shortest_attempt
+                avg_duration = self._sum_duration / len(self.hold_attempts)
+                longest = longest_attempt['duration']
+                shortest = shortest_attempt['duration']
+
+                parts.append(f"Average Hold:         {avg_duration:.1f} seconds ({avg_duration / 60:.2f} minutes)\n")
+                parts.append(f"Longest Hold:         {longest:.1f} seconds ({longest / 60:.2f} minutes)\n")
+                parts.append(f"Shortest Hold:        {shortest:.1f} seconds ({shortest / 60:.2f} minutes)\n")
+
+                parts.append("\n")
+                parts.append(
+                    f"Longest attempt was #{longest_attempt['number']} at {longest_attempt['start_time']:%H:%M:%S}\n")
+                parts.append(
+                    f"Shortest attempt was #{shortest_attempt['number']} at {shortest_attempt['start_time']:%H:%M:%S}\n")
+            else:
+                parts.append("No hold attempts recorded.\n")
+
+            parts.append("\n")
+            parts.append(_HDR)
+            parts.append("END OF REPORT\n")
+            parts.append(_HDR)
+
+            snapshot = ReportSnapshot.render("".join(parts))
 
         except Exception as e:
             logger.error(f"Failed to generate final report: {e}")
 
-    def get_board_angle(self) -> Optional[float]:
-        """Get current board angle from sensors"""
-        angles = self.sensor_queue.get_all_angles()
+        finally:
+            # Always hand the fd back for fsync + close, with or without the summary
+            try:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(_report_executor, _finish_report_file, fd, snapshot)
+                if snapshot is not None:
+                    logger.info(f"✓ Final report saved: {self.report_file}")
+                else:
+                    logger.info(f"✓ Report closed: {self.report_file}")
+            except Exception as e:
+                logger.error(f"✗ Report close failed: {e}")
+
+    async def close_report(self):
+        """Flush the report to disk and close it without a final summary"""
+        fd = self._report_fd
+        if fd is None:
+            return
+        self._report_fd = None
 
-        # Try primary sensor first
-        if 'w_back.txt' in angles and angles['w_back.txt'] is not None:
-            return angles['w_back.txt']
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_report_executor, _finish_report_file, fd)
+            logger.info(f"✓ Report closed: {self.report_file}")
+        except Exception as e:
+            logger.error(f"✗ Report close failed: {e}")
 
-        # Try backup sensor
-        if 'Orientation.txt' in angles and angles['Orientation.txt'] is not None:
-            return angles['Orientation.txt']
+    def get_board_angle(self) -> Optional[float]:
+        """Get current board angle (cached for the current update tick)"""
+        if self._tick_angle is not _UNSET:
+            return self._tick_angle
+        return self._read_board_angle()
 
-        return None
+    def _read_board_angle(self) -> Optional[float]:
+        """Read board angle from sensors (primary w_back, backup Orientation)"""
+        return self.sensor_queue.get_primary_angle()
 
-    def is_board_level(self) -> bool:
+    def is_board_level(self, angle=_UNSET) -> bool:
         """
         Check if board is level (within threshold)
         - ANY negative angle = LEVEL
         - Positive angles: 0° to +10° = LEVEL
+        Pass an already-read angle to skip the sensor lookup
         """
-        angle = self.get_board_angle()
+        if angle is _UNSET:
+            angle = self.get_board_angle()
 
         if angle is None:
             return False
@@ -266,36 +376,44 @@ class HoldingGame:
     def remaining_time(self) -> float:
         return self.training_goal - self.accumulated_hold_time
 
-    def is_deadline_reached(self) -> bool:
-        if self.deadline is None:
+    def is_deadline_reached(self, now: Optional[float] = None) -> bool:
+        if self._deadline_mono is None:
             return False
-        return datetime.now() >= self.deadline
+        if now is None:
+            now = time.monotonic()
+        return now >= self._deadline_mono
 
     async def start_game(self):
         """Start the actual game"""
         self.game_started = True
         self.start_time = datetime.now()
         self.deadline = self.start_time + timedelta(hours=GAME_DURATION_HOURS)
+        self._deadline_mono = time.monotonic() + GAME_DURATION_HOURS * 3600
         self.session_start = self.start_time
+        self.start_str = f"{self.start_time:%Y-%m-%d %H:%M:%S}"
+        await self._create_report()
 
         logger.info("=" * 60)
-        logger.info(f"GAME STARTED: {self.start_time.strftime('%H:%M:%S')}")
-        logger.info(f"Deadline: {self.deadline.strftime('%H:%M:%S')}")
+        logger.info(f"GAME STARTED: {self.start_time:%H:%M:%S}")
+        logger.info(f"Deadline: {self.deadline:%H:%M:%S}")
         logger.info("=" * 60)
 
         # Start in NOT HOLDING state
         await self.enter_not_holding_state()
 
-    async def enter_not_holding_state(self):
+    async def enter_not_holding_state(self, now: Optional[float] = None):
         """Enter NOT HOLDING state"""
+        if now is None:
+            now = time.monotonic()
         self.state = HoldingState.NOT_HOLDING
         self.currently_holding = False
 
         # Stop current hold timer if active
         if self.current_hold_start > 0:
-            hold_start_time = datetime.fromtimestamp(self.current_hold_start)
-            hold_end_time = datetime.now()
-            hold_duration = time.time() - self.current_hold_start
+            # One clock read per transition: end wall time derives from the monotonic duration
+            hold_duration = now - self.current_hold_start
+            hold_start_time = self.current_hold_start_wall
+            hold_end_time = hold_start_time + timedelta(seconds=hold_duration)
 
             self.accumulated_hold_time += hold_duration
 
@@ -303,62 +421,97 @@ class HoldingGame:
             self._log_hold_attempt(hold_start_time, hold_end_time, hold_duration)
 
             # Console logging
-            current_angle = self.get_board_angle()
-            logger.info(f"Hold ended - Duration: {hold_duration:.1f}s (angle now: {current_angle:.1f}°)")
-            logger.info(f"Total: {self.accumulated_hold_time / 60:.1f} min")
-            logger.info(f"Remaining: {self.remaining_time / 60:.1f} min")
+            if logger.isEnabledFor(logging.INFO):
+                current_angle = self.get_board_angle()
+                angle_str = f"{current_angle:.1f}°" if current_angle is not None else "no data"
+                logger.info("Hold ended - Duration: %.1fs (angle now: %s)", hold_duration, angle_str)
+                logger.info("Total: %.1f min", self.accumulated_hold_time / 60)
+                logger.info("Remaining: %.1f min", self.remaining_time / 60)
             self.current_hold_start = 0
 
-        await heat_control("off")
-        await bulb_1_control("off")
-        await bulb_2_control("off")
+        self._cancel_hold_flash()
+        await asyncio.gather(heat_control("off"), bulb_1_control("off"), bulb_2_control("off"))
         start_white_noise()
 
-        self.next_reminder_time = time.time() + random.randint(
-            REMINDER_INTERVAL_MIN, REMINDER_INTERVAL_MAX
-        )
+        self._schedule_reminder(self._next_reminder_interval())
         logger.info("→ NOT HOLDING (white noise ON)")
 
-    async def enter_holding_state(self):
+    async def enter_holding_state(self, now: Optional[float] = None):
         """Enter HOLDING state"""
+        if now is None:
+            now = time.monotonic()
         self.state = HoldingState.HOLDING
         self.currently_holding = True
-        self.current_hold_start = time.time()
+        self._cancel_reminder()
+        self.current_hold_start = now
+        self.current_hold_start_wall = datetime.now()
+        self._next_hold_log_time = now + HOLD_LOG_INTERVAL
 
         # Log with current angle
-        current_angle = self.get_board_angle()
-        logger.info(f"✓ HOLDING state! (angle: {current_angle:.1f}°)")
+        logger.info("✓ HOLDING state! (angle: %.1f°)", self.get_board_angle())
 
         stop_white_noise()
-        await heat_control("on")
-        await bulb_1_control("on")
-        await bulb_2_control("on")
-        await asyncio.sleep(HOLD_CONFIRMATION_DURATION)
-        await bulb_1_control("off")
-        await bulb_2_control("off")
+        await asyncio.gather(heat_control("on"), bulb_1_control("on"), bulb_2_control("on"))
+        # Bulbs go off in the background so the tick keeps watching the board
+        self._cancel_hold_flash()
+        self._flash_task = asyncio.create_task(self._hold_confirmation_flash())
 
         logger.info("→ HOLDING (white noise OFF, heat ON)")
 
+    async def _hold_confirmation_flash(self):
+        """Keep confirmation bulbs on briefly, then turn them off"""
+        await asyncio.sleep(HOLD_CONFIRMATION_DURATION)
+        await asyncio.gather(bulb_1_control("off"), bulb_2_control("off"))
+
+    def _cancel_hold_flash(self):
+        if self._flash_task and not self._flash_task.done():
+            self._flash_task.cancel()
+        self._flash_task = None
+
+    def _next_reminder_interval(self) -> int:
+        interval = self._reminder_intervals[self._reminder_ix & (_REMINDER_RING_SIZE - 1)]
+        self._reminder_ix += 1
+        return interval
+
+    def _schedule_reminder(self, delay: float):
+        """Arm the next NOT_HOLDING reminder on the event loop timer"""
+        self._cancel_reminder()
+        self._reminder_handle = asyncio.get_running_loop().call_later(delay, self._fire_reminder)
+
+    def _cancel_reminder(self):
+        """Disarm the reminder timer and stop a reminder flash in progress"""
+        if self._reminder_handle:
+            self._reminder_handle.cancel()
+            self._reminder_handle = None
+        if self._reminder_task and not self._reminder_task.done():
+            self._reminder_task.cancel()
+        self._reminder_task = None
+
+    def _fire_reminder(self):
+        self._reminder_handle = None
+        if self.is_running and self.state == HoldingState.NOT_HOLDING:
+            self._reminder_task = asyncio.create_task(self.show_reminder())
+
     async def show_reminder(self):
         logger.info("Reminder: Board not level")
-        await bulb_1_control("on")
-        await bulb_2_control("on")
+        await asyncio.gather(bulb_1_control("on"), bulb_2_control("on"))
         await asyncio.sleep(REMINDER_DURATION)
-        await bulb_1_control("off")
-        await bulb_2_control("off")
-        self.next_reminder_time = time.time() + random.randint(
-            REMINDER_INTERVAL_MIN, REMINDER_INTERVAL_MAX
-        )
+        await asyncio.gather(bulb_1_control("off"), bulb_2_control("off"))
+        self._reminder_task = None  # Done - don't let re-arming cancel this task
+        if self.is_running and self.state == HoldingState.NOT_HOLDING:
+            self._schedule_reminder(self._next_reminder_interval())
 
     async def end_game(self):
         """End the game"""
         self.state = HoldingState.FINISHED
         self.is_running = False
         self.session_end = datetime.now()
+        self._cancel_hold_flash()
+        self._cancel_reminder()
 
         # Stop any active hold timer
         if self.current_hold_start > 0:
-            hold_duration = time.time() - self.current_hold_start
+            hold_duration = time.monotonic() - self.current_hold_start
             self.accumulated_hold_time += hold_duration
 
         logger.info("=" * 60)
@@ -375,7 +528,7 @@ class HoldingGame:
         logger.info("=" * 60)
 
         # Generate final report
-        self.generate_final_report()
+        await self.generate_final_report()
 
         # Stop white noise if playing
         stop_white_noise()
@@ -384,8 +537,6 @@ class HoldingGame:
         await self.game_end_sequence()
 
     async def game_end_sequence(self):
-        from audio import play_audio_from_folder
-
         logger.info("GAME END SEQUENCE")
         play_audio_from_folder('audio_holding/holding_over', 'Complete')
         await all_bulbs_on()
@@ -393,28 +544,35 @@ class HoldingGame:
         wait_time = random.randint(3 * 60, 5 * 60)
         logger.info(f"Waiting {wait_time / 60:.1f} min before plug...")
 
-        elapsed = 0
-        while elapsed < wait_time:
-            await asyncio.sleep(10)
-            elapsed += 10
+        logger_task = asyncio.create_task(countdown_logger(wait_time))
+        try:
+            await asyncio.sleep(wait_time)
+        finally:
+            logger_task.cancel()
 
-        await plug_control("on")
-        await strobe_control("on")
+        await asyncio.gather(plug_control("on"), strobe_control("on"))
         logger.info("✓ Plug activated, strobe ON")
 
-        while True:
-            await all_bulbs_on()
-            await strobe_control("on")
-            await plug_control("on")
-            await asyncio.sleep(30)
+        await hold_end_state(retry_interval=30, label="Holding end maintenance", strobe=True)
+
+    async def update(self, delta_time: float, now: Optional[float] = None) -> Optional[float]:
+        """
+        Run one game tick
+        Returns the time.monotonic() at which the next tick is needed (None = default poll)
+        """
+        if now is None:
+            now = time.monotonic()
+        self._tick_now = now
+        angle = self._tick_angle = self._read_board_angle()
+        level = self.is_board_level(angle)
 
-    async def update(self, delta_time: float):
         try:
             if self.critical_error:
+                await self.close_report()
                 await emergency_shutdown()
                 return
 
-            if self.is_deadline_reached():
+            if self.is_deadline_reached(now):
                 await self.end_game()
                 return
 
@@ -424,42 +582,55 @@ class HoldingGame:
 
             # Main state logic
             if self.state == HoldingState.NOT_HOLDING:
-                if self.is_board_level():
-                    await self.enter_holding_state()
-                elif time.time() >= self.next_reminder_time:
-                    await self.show_reminder()
+                if level:
+                    await self.enter_holding_state(now)
 
             elif self.state == HoldingState.HOLDING:
                 # Check if still level
-                current_angle = self.get_board_angle()
-                is_level = self.is_board_level()
-
-                if not is_level:
-                    logger.info(f"⚠️ Lost level position (angle: {current_angle:.1f}°)")
-                    await self.enter_not_holding_state()
-                elif self.current_hold_start > 0:
-                    current_hold = time.time() - self.current_hold_start
-                    total = self.accumulated_hold_time + current_hold
-
-                    # Log progress every 30 seconds
-                    if int(current_hold) % 30 == 0 and current_hold > 0:
-                        logger.info(
-                            f"Holding: {current_hold:.0f}s | Total: {total / 60:.1f} min | Angle: {current_angle:.1f}°")
+                if not level:
+                    logger.info("⚠️ Lost level position (angle: %s)",
+                                f"{angle:.1f}°" if angle is not None else "no data")
+                    await self.enter_not_holding_state(now)
+                # Log progress every 30 seconds (once per window)
+                elif self.current_hold_start > 0 and now >= self._next_hold_log_time:
+                    self._next_hold_log_time += HOLD_LOG_INTERVAL
+                    current_hold = now - self.current_hold_start
+                    logger.info("Holding: %.0fs | Total: %.1f min | Angle: %.1f°",
+                                current_hold, (self.accumulated_hold_time + current_hold) / 60, angle)
+
+            # Next meaningful deadline: sensor poll or game deadline (reminders run on their own timer)
+            next_wake = now + SENSOR_POLL_INTERVAL
+            if self._deadline_mono is not None:
+                next_wake = min(next_wake, self._deadline_mono)
+            return next_wake
 
         except Exception as e:
             logger.critical(f"Error: {e}", exc_info=True)
             self.critical_error = True
 
+        finally:
+            self._tick_angle = _UNSET
+
 async def game_loop(game: HoldingGame):
-    last_time = time.time()
+    # Bind loop-invariant lookups once
+    clock = time.monotonic
+    update = game.update
+    sleep = asyncio.sleep
+
+    last_time = clock()
     while game.is_running:
         try:
-            current_time = time.time()
+            current_time = clock()
             delta_time = current_time - last_time
             last_time = current_time
-            await game.update(delta_time)
-            await asyncio.sleep(1 / 60)
+            next_wake = await update(delta_time, current_time)
+            if next_wake is None:
+                next_wake = current_time + SENSOR_POLL_INTERVAL
+
+            # Sleep until the next poll or the game deadline, whichever comes first
+            await sleep(max(0.0, next_wake - clock()))
         except Exception as e:
             logger.critical(f"Game loop error: {e}", exc_info=True)
+            await game.close_report()
             await emergency_shutdown()
             break
\ No newline at end of file
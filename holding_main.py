@@ -5,16 +5,18 @@ Holding Training - Main Launcher
 
 import asyncio
 import logging
-import signal
+import random
 import sys
 from typing import Optional
 
-from main_wit import main as sensor_main
+from main_wit import main as sensor_main, SensorDataQueue
 from holding_game import HoldingGame, game_loop
-from hardware import emergency_shutdown, read_button, strobe_control, all_bulbs_on, heat_control, \
-    send_vibration  # ← ADD read_button HERE
-from config import PREGAME_WAIT_MIN, PREGAME_WAIT_MAX, PREGAME_WAIT_MIN_TESTING, PREGAME_WAIT_MAX_TESTING, TESTING_MODE
-from audio import cleanup_audio, play_audio_from_folder
+from hardware import emergency_shutdown, strobe_control, all_bulbs_on, all_bulbs_off, set_outputs, \
+    send_vibration, wait_for_button_press, stop_button_poller
+from config import PREGAME_WAIT_MIN, PREGAME_WAIT_MAX, PREGAME_WAIT_MIN_TESTING, PREGAME_WAIT_MAX_TESTING, TESTING_MODE, \
+    BUTTON_1
+from audio import cleanup_audio, play_audio_from_folder, stop_audio
+from runner import cancel_task, install_signal_handlers, run
 
 # Configure logging
 logging.basicConfig(
@@ -37,8 +39,6 @@ async def pregame_sensor_test():
     Pregame sensor test - board level controls strobe
     Runs BEFORE button calibration sequence
     """
-    from main_wit import SensorDataQueue
-
     logger.info("=" * 60)
     logger.info("PREGAME SENSOR TEST")
     logger.info("=" * 60)
@@ -47,25 +47,17 @@ async def pregame_sensor_test():
     logger.info("=" * 60)
 
     # Turn on all devices
-    await all_bulbs_on()
-    await heat_control("on")
-    await strobe_control("on")
+    await set_outputs(bulb_1=True, bulb_2=True, heat=True, strobe=True)
 
     sensor_queue = SensorDataQueue()
     strobe_state = "on"
-    last_button_value = await read_button(227)
+    press_task = asyncio.create_task(wait_for_button_press(BUTTON_1))
 
     logger.info("✓ Pregame test active - move board to test sensor")
 
     while True:
-        # Get board angle
-        angles = sensor_queue.get_all_angles()
-        angle = None
-
-        if 'w_back.txt' in angles and angles['w_back.txt'] is not None:
-            angle = angles['w_back.txt']
-        elif 'Orientation.txt' in angles and angles['Orientation.txt'] is not None:
-            angle = angles['Orientation.txt']
+        # Get board angle (primary, falling back to backup)
+        angle = sensor_queue.get_primary_angle()
 
         # Check if level - SAME LOGIC AS GAME
         # ANY negative = level
@@ -91,46 +83,25 @@ async def pregame_sensor_test():
             else:
                 logger.info("⚠️ No sensor data - strobe ON")
 
-        # Check for button press
-        current_button = await read_button(227)
-        if current_button is not None and last_button_value is not None:
-            if current_button > last_button_value:
-                logger.info("Button pressed - exiting pregame test")
-                await strobe_control("off")
-                return
-        last_button_value = current_button
-
-        await asyncio.sleep(0.1)
+        # Wait up to 0.1s for the button press (wakes immediately on a press)
+        await asyncio.wait({press_task}, timeout=0.1)
+        if press_task.done():
+            logger.info("Button pressed - exiting pregame test")
+            await strobe_control("off")
+            return
 
 
 async def sensor_calibration_mode():
     """
     3-button press sequence with audio feedback
     """
-    import random
-    import pygame
-
     logger.info("=" * 60)
     logger.info("HOLDING TRAINING - BUTTON SEQUENCE")
     logger.info("=" * 60)
     logger.info("Waiting for first Button 2 press...")
 
-    async def wait_for_button_press():
-        """Wait for button 2 press (rising edge)"""
-        last_value = await read_button(227)
-
-        while True:
-            current_value = await read_button(227)
-
-            if current_value is not None and last_value is not None:
-                if current_value > last_value:
-                    return True
-
-            last_value = current_value
-            await asyncio.sleep(0.1)
-
     # FIRST PRESS - Introduction (SKIPPABLE)
-    await wait_for_button_press()
+    await wait_for_button_press(BUTTON_1)
     logger.info("✓ First press - Playing introduction (press again to skip)")
     await send_vibration()
 
@@ -138,46 +109,41 @@ async def sensor_calibration_mode():
     duration = play_audio_from_folder('audio_holding/holding_intro', 'Introduction')
 
     if duration > 0:
-        intro_start = asyncio.get_event_loop().time()
-        last_value = await read_button(227)
-
-        while asyncio.get_event_loop().time() - intro_start < duration + 0.3:
-            # Check for button press to skip
-            current_value = await read_button(227)
-            if current_value is not None and last_value is not None:
-                if current_value > last_value:
-                    logger.info("✓ Intro skipped by button press")
-                    pygame.mixer.stop()
-                    pygame.mixer.music.stop()
-                    break
-            last_value = current_value
-            await asyncio.sleep(0.1)
+        try:
+            # Button press skips the rest of the intro
+            await asyncio.wait_for(wait_for_button_press(BUTTON_1), timeout=duration + 0.3)
+            logger.info("✓ Intro skipped by button press")
+            stop_audio()
+        except asyncio.TimeoutError:
+            pass
 
     await asyncio.sleep(0.5)
 
     # SECOND PRESS - First confirmation
     logger.info("Waiting for second Button 2 press...")
-    await wait_for_button_press()
+    await wait_for_button_press(BUTTON_1)
     logger.info("✓ Second press - First confirmation")
     play_audio_from_folder('audio_holding/first_press', 'First confirmation')
     await send_vibration()
 
     await all_bulbs_on()
     await asyncio.sleep(1)
-    await all_bulbs_on()  # Toggle off
+    await all_bulbs_off()
     await asyncio.sleep(2)
 
     # THIRD PRESS - Final confirmation
     logger.info("Waiting for third Button 2 press...")
-    await wait_for_button_press()
+    await wait_for_button_press(BUTTON_1)
     logger.info("✓ Third press - Final confirmation")
     play_audio_from_folder('audio_holding/second_press', 'Final confirmation')
     await send_vibration()
 
-    await all_bulbs_on()
-    await strobe_control("on")
+    await set_outputs(bulb_1=True, bulb_2=True, strobe=True)
     await asyncio.sleep(2)
-    await strobe_control("off")
+    await set_outputs(strobe=False)
+
+    # Button presses are done - stop polling them
+    stop_button_poller()
 
     # Wait before starting
     if TESTING_MODE:
@@ -243,21 +209,11 @@ async def cleanup():
             game.is_running = False
             logger.info("✓ Game stopped")
 
-        if sensor_task and not sensor_task.done():
-            sensor_task.cancel()
-            try:
-                await sensor_task
-            except asyncio.CancelledError:
-                pass
-            logger.info("✓ Sensor system stopped")
-
-        if game_task and not game_task.done():
-            game_task.cancel()
-            try:
-                await game_task
-            except asyncio.CancelledError:
-                pass
-            logger.info("✓ Game task cancelled")
+        await cancel_task(sensor_task, "Sensor system")
+        await cancel_task(game_task, "Game task")
+
+        if game:
+            await game.close_report()
 
         cleanup_audio()
         logger.info("✓ Audio cleaned up")
@@ -279,12 +235,5 @@ def signal_handler(signum, frame):
 
 
 if __name__ == "__main__":
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        pass
-    finally:
-        logger.critical("Program terminated.")
\ No newline at end of file
+    install_signal_handlers(signal_handler)
+    run(main)
\ No newline at end of file
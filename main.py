@@ -6,23 +6,32 @@ Phase 1: Core Infrastructure Testing
 Run this file to start the game
 """
 import atexit
-import signal
 import asyncio
 import logging
+import logging.handlers
+import queue
 import sys
 import random
 from datetime import datetime, timedelta
 from main_wit import set_angle_printing
 
 # Configure logging
+# Records are queued on the event loop thread; a listener thread does the file/console writes
+# force=True: main_wit has already called basicConfig() during import
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(f'game_{datetime.now():%Y%m%d_%H%M%S}.log', delay=True),
+    logging.StreamHandler(sys.stdout)
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'game_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+    force=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Registered first, so it runs last and flushes cleanup logs
 
 logger = logging.getLogger('main')
 
@@ -32,14 +41,17 @@ try:
     from hardware import (
         hardware_state, start_hardware_monitoring, stop_hardware_monitoring,
         bulb_1_control, bulb_2_control, all_bulbs_off, all_bulbs_on,
-        read_button, send_vibration, plug_control
+        read_buttons, send_vibration, plug_control, close_session,
+        subscribe_button_presses, unsubscribe_button_presses
     )
     from audio import (
-        audio_manager, start_white_noise, stop_white_noise,
+        audio_manager, start_white_noise, stop_white_noise, stop_audio,
+        play_audio, play_intro_audio,
         play_first_press, play_second_press, play_sensor_issue,
         play_sensor_issue_resolved
     )
     from game import UpDownGame, game_loop
+    from runner import cancel_task, install_signal_handlers, run
 except ImportError as e:
     logger.critical(f"Failed to import modules: {e}")
     logger.critical("Make sure all files are in the same directory:")
@@ -47,6 +59,7 @@ except ImportError as e:
     logger.critical("  - hardware.py")
     logger.critical("  - audio.py")
     logger.critical("  - game.py")
+    logger.critical("  - runner.py")
     logger.critical("  - main_wit.py (sensor system)")
     sys.exit(1)
 
@@ -64,7 +77,6 @@ async def safe_audio(audio_func, fallback_message):
     Safely play audio - if it fails, just log and continue
     """
     try:
-        from audio import play_audio
         play_audio(audio_func, fallback_message)
     except Exception as e:
         logger.warning(f"Audio failed: {e} - continuing anyway")
@@ -80,43 +92,37 @@ async def wait_for_sensors():
     logger.info("=" * 70)
 
     timeout = 30
-    start_time = asyncio.get_event_loop().time()
-
-    primary_connected = False
-    backup_connected = False
-
-    logger.info("Testing button reads...")
-    for i in range(5):
-        b1 = await read_button(BUTTON_1)
-        b2 = await read_button(BUTTON_2)
-        logger.info(f"  Test {i + 1}: Button1={b1}, Button2={b2}")
-        await asyncio.sleep(0.5)
-    logger.info("Button test complete. Starting calibration...")
-
-    while asyncio.get_event_loop().time() - start_time < timeout:
-        primary_state = sensor_queue.get_sensor_state('w_back.txt')
-        backup_state = sensor_queue.get_sensor_state('Orientation.txt')
-
-        # Check primary
-        if primary_state.value == 'connected' and not primary_connected:
-            primary_connected = True
-            logger.info("✓ Primary sensor (w_back.txt) CONNECTED")
-
-        # Check backup
-        if backup_state.value == 'connected' and not backup_connected:
-            backup_connected = True
-            logger.info("✓ Backup sensor (Orientation.txt) CONNECTED")
-
-        # Both connected?
-        if primary_connected and backup_connected:
-            logger.info("")
-            logger.info("=" * 70)
-            logger.info(" ✓ BOTH SENSORS CONNECTED")
-            logger.info("=" * 70)
-            logger.info("")
-            return True
 
-        await asyncio.sleep(0.5)
+    if TESTING_MODE:
+        logger.info("Testing button reads...")
+        for i in range(5):
+            buttons = await read_buttons()
+            logger.info(f"  Test {i + 1}: Button1={buttons[BUTTON_1]}, Button2={buttons[BUTTON_2]}")
+            await asyncio.sleep(0.5)
+        logger.info("Button test complete. Starting calibration...")
+
+    async def announce_connected(sensor_id: str, label: str):
+        await sensor_queue.connected_event(sensor_id).wait()
+        logger.info(f"✓ {label} sensor ({sensor_id}) CONNECTED")
+
+    # Woken by the first valid frame from each sensor instead of polling states
+    primary_task = asyncio.create_task(announce_connected('w_back.txt', 'Primary'))
+    backup_task = asyncio.create_task(announce_connected('Orientation.txt', 'Backup'))
+    done, pending = await asyncio.wait({primary_task, backup_task}, timeout=timeout)
+    for task in pending:
+        task.cancel()
+
+    primary_connected = primary_task in done
+    backup_connected = backup_task in done
+
+    # Both connected?
+    if primary_connected and backup_connected:
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info(" ✓ BOTH SENSORS CONNECTED")
+        logger.info("=" * 70)
+        logger.info("")
+        return True
 
     # Timeout - check what we have
     logger.warning("")
@@ -136,76 +142,45 @@ async def wait_for_sensors():
         return False
 
 
-async def sensor_calibration_mode():
+async def calibration_angle_monitor(blink_queue: asyncio.Queue):
     """
-    Continuous sensor monitoring with bulb feedback
-    - Both bulbs stay ON
-    - Bulb_1 blinks when angle < DOWN threshold
-    - Bulb_2 blinks when angle > UP threshold
+    Calibration sensor display
     - Print angles every 2 seconds
-    - Wait for TWO button presses (10-second timeout after first press)
+    - Queue a bulb blink when the angle crosses the DOWN / UP threshold
     """
-    logger.info("=" * 70)
-    logger.info(" SENSOR CALIBRATION MODE")
-    logger.info("=" * 70)
-    logger.info("Monitoring sensors... Bulbs will blink at threshold crossings")
-    logger.info("Angles printed every 2 seconds")
-    logger.info("Press ANY button to begin")
-    logger.info("=" * 70)
-    logger.info("")
-
-    # Turn on both bulbs (they stay on throughout calibration)
-    await bulb_1_control("on")
-    await bulb_2_control("on")
-
-    # Initialize button state - GIVE IT TIME TO READ FIRST
-    await asyncio.sleep(0.5)  # ADD THIS
-    last_button_1_value = await read_button(BUTTON_1)
-    last_button_2_value = await read_button(BUTTON_2)
-
-    # Log initial button values for debugging
-    logger.info(f"Initial button states: Button1={last_button_1_value}, Button2={last_button_2_value}")
+    loop_time = asyncio.get_running_loop().time
+    latest = sensor_queue.latest_angles  # Single-slot store, read without the lock
 
     # Track threshold crossings to avoid repeated blinks
     last_was_down = False
     last_was_up = False
 
-    # State machine
-    # State machine
-    waiting_for_first = True
-    waiting_for_second = False
-    waiting_for_third = False
-    second_press_deadline = 0
-
     # Print timing
     last_print_time = 0
     print_interval = 2.0  # Print every 2 seconds
 
     while True:
         try:
-            current_time = asyncio.get_event_loop().time()
+            current_time = loop_time()
 
-            # Get sensor data
-            angles = sensor_queue.get_all_angles()
-            states = {
-                'w_back.txt': sensor_queue.get_sensor_state('w_back.txt'),
-                'Orientation.txt': sensor_queue.get_sensor_state('Orientation.txt')
-            }
+            # Get sensor data (None until a sensor has reported)
+            primary_angle = latest.get('w_back.txt')
+            backup_angle = latest.get('Orientation.txt')
 
             # Print sensor data every 2 seconds
             if current_time - last_print_time >= print_interval:
-                primary_angle = angles.get('w_back.txt', None)
-                backup_angle = angles.get('Orientation.txt', None)
+                primary_state = sensor_queue.get_sensor_state('w_back.txt')
+                backup_state = sensor_queue.get_sensor_state('Orientation.txt')
 
+                primary_str = 'N/A' if primary_angle is None else str(primary_angle)
+                backup_str = 'N/A' if backup_angle is None else str(backup_angle)
                 print(
-                    f"[Primary: w_back.txt] Angle: {primary_angle if primary_angle else 'N/A':>6}° [{states['w_back.txt'].value:>12}]  |  "
-                    f"[Backup: Orientation.txt] Angle: {backup_angle if backup_angle else 'N/A':>6}° [{states['Orientation.txt'].value:>12}]")
+                    f"[Primary: w_back.txt] Angle: {primary_str:>6}° [{primary_state.value:>12}]  |  "
+                    f"[Backup: Orientation.txt] Angle: {backup_str:>6}° [{backup_state.value:>12}]")
 
                 last_print_time = current_time
 
             # Determine which sensor to use for threshold checking
-            primary_angle = angles.get('w_back.txt', None)
-            backup_angle = angles.get('Orientation.txt', None)
             active_angle = primary_angle if primary_angle is not None else backup_angle
 
             if active_angle is not None:
@@ -213,184 +188,168 @@ async def sensor_calibration_mode():
                 is_down = active_angle < ANGLE_DOWN_THRESHOLD
                 if is_down and not last_was_down:
                     logger.info(f"✓ DOWN threshold crossed ({active_angle:.1f}°) - Bulb 1 blink")
-                    await bulb_1_control("off")
-                    await asyncio.sleep(0.3)
-                    await bulb_1_control("on")
+                    blink_queue.put_nowait(bulb_1_control)
                 last_was_down = is_down
 
                 # Check UP threshold (blink Bulb_2)
                 is_up = active_angle > ANGLE_UP_THRESHOLD
                 if is_up and not last_was_up:
                     logger.info(f"✓ UP threshold crossed ({active_angle:.1f}°) - Bulb 2 blink")
-                    await bulb_2_control("off")
-                    await asyncio.sleep(0.3)
-                    await bulb_2_control("on")
+                    blink_queue.put_nowait(bulb_2_control)
                 last_was_up = is_up
 
-            # Check for button presses
-            current_button_1 = await read_button(BUTTON_1)
-            current_button_2 = await read_button(BUTTON_2)
-
-            button_pressed = False
-            button_name = ""
-
-            # Check Button 1
-            if current_button_1 is not None and last_button_1_value is not None:
-                if current_button_1 > last_button_1_value:
-                    button_pressed = True
-                    button_name = "Button 1"
-                    logger.debug(f"Button 1: {last_button_1_value} → {current_button_1}")
-
-            # Check Button 2
-            if current_button_2 is not None and last_button_2_value is not None:
-                if current_button_2 > last_button_2_value:
-                    button_pressed = True
-                    button_name = "Button 2"
-                    logger.debug(f"Button 2: {last_button_2_value} → {current_button_2}")
-
-            # Update last values
-            if current_button_1 is not None:
-                last_button_1_value = current_button_1
-            if current_button_2 is not None:
-                last_button_2_value = current_button_2
-
-            # ===================================================================
-            # STATE MACHINE: THREE BUTTON PRESSES
-            # ===================================================================
-            if button_pressed:
-                if waiting_for_first:
-                    # ============ FIRST PRESS: PLAY INTRO (SKIPPABLE) ============
-                    logger.info("")
-                    logger.info("=" * 70)
-                    logger.info(f"{button_name} pressed! (1/3)")
-                    logger.info("PLAYING INTRO AUDIO...")
-                    logger.info("Press button again to skip")
-                    logger.info("=" * 70)
-                    logger.info("")
-
-                    # Play intro audio and wait for it to finish (or skip)
-                    from audio import play_intro_audio
-                    intro_duration = play_intro_audio()
-
-                    intro_skipped = False
-
-                    if intro_duration > 0:
-                        logger.info(f"Intro playing ({intro_duration:.1f} seconds)...")
-
-                        # Wait for intro to finish, but check for button presses to skip
-                        elapsed = 0
-                        check_interval = 0.1  # Check every 100ms
-
-                        while elapsed < intro_duration + 0.5:
-                            # Check for button press to skip
-                            check_button_1 = await read_button(BUTTON_1)
-                            check_button_2 = await read_button(BUTTON_2)
-
-                            skip_pressed = False
-
-                            # Check if either button was pressed (rising edge detection)
-                            if check_button_1 is not None and last_button_1_value is not None:
-                                if check_button_1 > last_button_1_value:
-                                    skip_pressed = True
-                                    logger.info("✓ Button 1 pressed - SKIPPING INTRO")
+        except Exception as e:
+            logger.error(f"Error in calibration angle monitor: {e}", exc_info=True)
 
-                            if check_button_2 is not None and last_button_2_value is not None:
-                                if check_button_2 > last_button_2_value:
-                                    skip_pressed = True
-                                    logger.info("✓ Button 2 pressed - SKIPPING INTRO")
+        await asyncio.sleep(0.1)  # 10Hz update
 
-                            # Update last values BEFORE checking skip
-                            if check_button_1 is not None:
-                                last_button_1_value = check_button_1
-                            if check_button_2 is not None:
-                                last_button_2_value = check_button_2
 
-                            if skip_pressed:
-                                # Stop the audio
-                                import pygame
-                                pygame.mixer.stop()
-                                intro_skipped = True
-                                logger.info("Intro audio stopped")
+async def calibration_bulb_blinker(blink_queue: asyncio.Queue):
+    """Blink the bulbs queued by calibration_angle_monitor (off 0.3s, then back on)"""
+    while True:
+        control = await blink_queue.get()
+        try:
+            await control("off")
+            await asyncio.sleep(0.3)
+            await control("on")
+        except Exception as e:
+            logger.error(f"Bulb blink failed: {e}")
 
-                                # CRITICAL: Re-read buttons after a delay to prevent double-detection
-                                await asyncio.sleep(0.3)
-                                last_button_1_value = await read_button(BUTTON_1)
-                                last_button_2_value = await read_button(BUTTON_2)
 
-                                break
+async def sensor_calibration_mode():
+    """
+    Continuous sensor monitoring with bulb feedback
+    - Both bulbs stay ON
+    - Bulb_1 blinks when angle < DOWN threshold
+    - Bulb_2 blinks when angle > UP threshold
+    - Print angles every 2 seconds
+    - Wait for TWO button presses (10-second timeout after first press)
+    """
+    logger.info("=" * 70)
+    logger.info(" SENSOR CALIBRATION MODE")
+    logger.info("=" * 70)
+    logger.info("Monitoring sensors... Bulbs will blink at threshold crossings")
+    logger.info("Angles printed every 2 seconds")
+    logger.info("Press ANY button to begin")
+    logger.info("=" * 70)
+    logger.info("")
 
-                            # Sleep for check interval
-                            await asyncio.sleep(check_interval)
-                            elapsed += check_interval
-                    else:
-                        logger.warning("No intro played - continuing")
-                        await asyncio.sleep(2)
+    # Turn on both bulbs (they stay on throughout calibration)
+    await asyncio.gather(bulb_1_control("on"), bulb_2_control("on"))
 
-                    logger.info("")
-                    if intro_skipped:
-                        logger.info("Intro skipped - press button to confirm calibration")
-                    else:
-                        logger.info("Intro finished - press button within 10 seconds to confirm")
-                    logger.info("")
+    # Button presses arrive from the shared button poller
+    presses = subscribe_button_presses()
+    button_names = {BUTTON_1: "Button 1", BUTTON_2: "Button 2"}
 
-                    waiting_for_first = False
-                    waiting_for_second = True
-                    second_press_deadline = asyncio.get_event_loop().time() + 10
+    # Angle printing and threshold blinks run beside the button sequence
+    blink_queue = asyncio.Queue()
+    monitor_tasks = [
+        asyncio.create_task(calibration_angle_monitor(blink_queue)),
+        asyncio.create_task(calibration_bulb_blinker(blink_queue)),
+    ]
 
-                elif waiting_for_second:
-                    # ============ SECOND PRESS: CONFIRMATION ============
+    try:
+        # ===================================================================
+        # STATE MACHINE: THREE BUTTON PRESSES
+        # ===================================================================
+        while True:
+            try:
+                # ============ FIRST PRESS: PLAY INTRO (SKIPPABLE) ============
+                button_name = button_names[await presses.get()]
+                logger.info("")
+                logger.info("=" * 70)
+                logger.info(f"{button_name} pressed! (1/3)")
+                logger.info("PLAYING INTRO AUDIO...")
+                logger.info("Press button again to skip")
+                logger.info("=" * 70)
+                logger.info("")
+
+                # Play intro audio and wait for it to finish (or skip)
+                intro_duration = play_intro_audio()
+
+                intro_skipped = False
+
+                if intro_duration > 0:
+                    logger.info(f"Intro playing ({intro_duration:.1f} seconds)...")
+
+                    # Wait for intro to finish, or a button press to skip it
+                    try:
+                        skip_button = await asyncio.wait_for(presses.get(), timeout=intro_duration + 0.5)
+                        logger.info(f"✓ {button_names[skip_button]} pressed - SKIPPING INTRO")
+
+                        # Stop the audio
+                        stop_audio()
+                        intro_skipped = True
+                        logger.info("Intro audio stopped")
+
+                        # CRITICAL: Drop presses queued right after the skip to prevent double-detection
+                        await asyncio.sleep(0.3)
+                        while not presses.empty():
+                            presses.get_nowait()
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    logger.warning("No intro played - continuing")
+                    await asyncio.sleep(2)
+
+                logger.info("")
+                if intro_skipped:
+                    logger.info("Intro skipped - press button to confirm calibration")
+                else:
+                    logger.info("Intro finished - press button within 10 seconds to confirm")
+                logger.info("")
+
+                # ============ SECOND PRESS: CONFIRMATION (10s window) ============
+                try:
+                    button_name = button_names[await asyncio.wait_for(presses.get(), timeout=10)]
+                except asyncio.TimeoutError:
                     logger.info("")
                     logger.info("=" * 70)
-                    logger.info(f"{button_name} pressed! (2/3)")
-                    logger.info("Calibration confirmed")
+                    logger.info("Timeout - press button to restart")
                     logger.info("=" * 70)
                     logger.info("")
+                    continue
 
-                    play_first_press()  # Confirmation beep
+                logger.info("")
+                logger.info("=" * 70)
+                logger.info(f"{button_name} pressed! (2/3)")
+                logger.info("Calibration confirmed")
+                logger.info("=" * 70)
+                logger.info("")
 
-                    logger.info("")
-                    logger.info("Press button ONE MORE TIME to start game...")
-                    logger.info("")
-
-                    waiting_for_second = False
-                    waiting_for_third = True
+                play_first_press()  # Confirmation beep
 
-                elif waiting_for_third:
-                    # ============ THIRD PRESS: START GAME ============
-                    logger.info("")
-                    logger.info("=" * 70)
-                    logger.info(f"{button_name} pressed! (3/3)")
-                    logger.info("STARTING GAME")
-                    logger.info("=" * 70)
-                    logger.info("")
+                logger.info("")
+                logger.info("Press button ONE MORE TIME to start game...")
+                logger.info("")
 
-                    play_second_press()
+                # ============ THIRD PRESS: START GAME ============
+                button_name = button_names[await presses.get()]
+                logger.info("")
+                logger.info("=" * 70)
+                logger.info(f"{button_name} pressed! (3/3)")
+                logger.info("STARTING GAME")
+                logger.info("=" * 70)
+                logger.info("")
 
-                    # Exit calibration mode
-                    break
+                play_second_press()
 
-            # Check timeout for second press
-            if waiting_for_second:
-                if asyncio.get_event_loop().time() > second_press_deadline:
-                    logger.info("")
-                    logger.info("=" * 70)
-                    logger.info("Timeout - press button to restart")
-                    logger.info("=" * 70)
-                    logger.info("")
+                # Exit calibration mode
+                break
 
-                    # Reset to waiting for first press
-                    waiting_for_first = True
-                    waiting_for_second = False
-                    waiting_for_third = False
+            except Exception as e:
+                logger.error(f"Error in calibration mode: {e}", exc_info=True)
+                await asyncio.sleep(1)
 
-            await asyncio.sleep(0.1)  # 10Hz update
+    except KeyboardInterrupt:
+        logger.info("\n\nCalibration interrupted")
+        raise
 
-        except KeyboardInterrupt:
-            logger.info("\n\nCalibration interrupted")
-            raise
-        except Exception as e:
-            logger.error(f"Error in calibration mode: {e}", exc_info=True)
-            await asyncio.sleep(1)
+    finally:
+        unsubscribe_button_presses(presses)
+        for task in monitor_tasks:
+            task.cancel()
+        await asyncio.gather(*monitor_tasks, return_exceptions=True)
 
     # Rest of function continues...
 
@@ -401,7 +360,6 @@ async def sensor_calibration_mode():
 
     # Turn on white noise
     try:
-        from audio import start_white_noise
         start_white_noise()
         logger.info("White noise ON")
     except Exception as e:
@@ -434,7 +392,6 @@ async def sensor_calibration_mode():
 
     # Stop white noise
     try:
-        from audio import stop_white_noise
         stop_white_noise()
     except Exception as e:
         logger.warning(f"Failed to stop white noise: {e}")
@@ -492,6 +449,12 @@ async def emergency_cleanup():
             await plug_control("on")
         except:
             pass
+    finally:
+        # This runs on its own event loop (asyncio.run) - close the HTTP session it opened
+        try:
+            await close_session()
+        except:
+            pass
 
 
 def sync_emergency_cleanup():
@@ -507,19 +470,13 @@ def sync_emergency_cleanup():
             pass
 
 
-# Register emergency cleanup on program exit
-atexit.register(sync_emergency_cleanup)
-
-
-# Register signal handlers for Ctrl+C, kill, etc.
 def signal_handler(signum, frame):
+    """Ctrl+C, kill, etc. - run emergency cleanup and exit"""
     logger.critical(f"Signal {signum} received - emergency cleanup")
     sync_emergency_cleanup()
     sys.exit(1)
 
 
-signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
-signal.signal(signal.SIGTERM, signal_handler)  # kill command
 async def main():
     """Main entry point with bulletproof cleanup"""
     game = None
@@ -557,8 +514,6 @@ async def main():
 
         if not sensors_ok:
             logger.critical("Cannot start without sensors - exiting")
-            if sensor_task:
-                sensor_task.cancel()
             return
 
         # Enter sensor calibration mode
@@ -619,9 +574,7 @@ async def main():
 
         try:
             # Stop sensors
-            if sensor_task:
-                sensor_task.cancel()
-                logger.info("✓ Sensor task cancelled")
+            await cancel_task(sensor_task, "Sensor task")
         except Exception as e:
             logger.error(f"Error cancelling sensor task: {e}")
 
@@ -645,19 +598,19 @@ async def main():
         except Exception as e:
             logger.critical(f"✗ Failed to activate plug: {e}")
 
+        try:
+            await close_session()
+        except Exception as e:
+            logger.error(f"Error closing HTTP session: {e}")
+
         logger.critical("=" * 70)
         logger.critical(" CLEANUP COMPLETE")
         logger.critical("=" * 70)
 
 
 if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        print("\n\nEXITING - Emergency cleanup...")
-        sync_emergency_cleanup()
-    except Exception as e:
-        logger.critical(f"Top-level error: {e}", exc_info=True)
-        sync_emergency_cleanup()
-    finally:
-        print("\nProgram terminated.")
\ No newline at end of file
+    # Emergency cleanup on ANY exit - program end, Ctrl+C or kill
+    atexit.register(sync_emergency_cleanup)
+    install_signal_handlers(signal_handler)
+
+    run(main, on_abort=sync_emergency_cleanup)
\ No newline at end of file
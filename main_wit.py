@@ -67,6 +67,20 @@ class SensorFrame:
             return False
 
 
+def _set_event_threadsafe(loop, event: Optional[asyncio.Event]):
+    """Set an asyncio.Event owned by loop from whichever thread we are on"""
+    if event is None or loop is None or loop.is_closed():
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        event.set()
+    else:
+        loop.call_soon_threadsafe(event.set)
+
+
 class SensorDataQueue:
     _instance = None
     _lock = threading.Lock()
@@ -88,6 +102,12 @@ class SensorDataQueue:
                 'Orientation.txt': SensorState.DISCONNECTED
             }
             cls._instance.last_update_time: Dict[str, float] = {}
+            # Latest angle per sensor - single-slot store, readers skip the lock
+            cls._instance.latest_angles: Dict[str, int] = {}
+            cls._instance._update_event: Optional[asyncio.Event] = None
+            cls._instance._update_loop = None
+            cls._instance._connected_events: Dict[str, asyncio.Event] = {}
+            cls._instance._connected_loop = None
         return cls._instance
 
     def add_frame(self, sensor_file: str, frame: SensorFrame):
@@ -100,20 +120,57 @@ class SensorDataQueue:
                 return
 
             self.queues[sensor_file].append(frame)
+            self.latest_angles[sensor_file] = frame.angle_x
             self.last_update_time[sensor_file] = time.time()
             self.sensor_states[sensor_file] = SensorState.CONNECTED
 
+        self._notify_update()
+        self._notify_connected(sensor_file)
+
+    def updated_event(self) -> asyncio.Event:
+        """Event set whenever a new frame arrives (bound to the calling event loop)"""
+        loop = asyncio.get_running_loop()
+        if self._update_loop is not loop:
+            self._update_event = asyncio.Event()
+            self._update_loop = loop
+        return self._update_event
+
+    def connected_event(self, sensor_id: str) -> asyncio.Event:
+        """Event set once sensor_id delivers a valid frame (bound to the calling event loop)"""
+        loop = asyncio.get_running_loop()
+        if self._connected_loop is not loop:
+            self._connected_events = {}
+            self._connected_loop = loop
+        event = self._connected_events.get(sensor_id)
+        if event is None:
+            event = self._connected_events[sensor_id] = asyncio.Event()
+            if sensor_id in self.latest_angles:
+                event.set()
+        return event
+
+    def _notify_update(self):
+        """Wake anyone waiting on updated_event() - safe from any thread"""
+        _set_event_threadsafe(self._update_loop, self._update_event)
+
+    def _notify_connected(self, sensor_id: str):
+        """Set connected_event(sensor_id) if anyone asked for it - safe from any thread"""
+        event = self._connected_events.get(sensor_id)
+        if event is not None and not event.is_set():
+            _set_event_threadsafe(self._connected_loop, event)
+
     def get_all_angles(self) -> Dict[str, int]:
-        """Get current X angles from all sensors"""
-        with self._lock:
-            angles = {}
-            for sensor_id, queue in self.queues.items():
-                if queue:  # If queue has data
-                    frame = queue[-1]  # Get latest frame
-                    angles[sensor_id] = frame.angle_x
-                else:
-                    angles[sensor_id] = 0
-            return angles
+        """Get current X angles from all sensors (0 for sensors with no data yet)"""
+        latest = self.latest_angles
+        return {sensor_id: latest.get(sensor_id, 0) for sensor_id in self.queues}
+
+    def get_primary_angle(self, sensor_ids=('w_back.txt', 'Orientation.txt')) -> Optional[int]:
+        """Latest X angle from the first sensor in sensor_ids that has data (None if none do)"""
+        latest = self.latest_angles
+        for sensor_id in sensor_ids:
+            angle = latest.get(sensor_id)
+            if angle is not None:
+                return angle
+        return None
 
     def get_sensor_state(self, sensor_id: str) -> SensorState:
         """Get the current state of a sensor"""
@@ -430,7 +487,7 @@ async def main():
             # Time to scan (initial or periodic)
             if current_time - last_scan_time >= RESCAN_INTERVAL:
                 scan_count += 1
-                logger.debug(f"Sensor scan #{scan_count}...")
+                logger.debug("Sensor scan #%d...", scan_count)
                 last_scan_time = current_time
 
                 # Scan for Bluetooth devices
@@ -0,0 +1,82 @@
+"""
+Launcher lifecycle helpers shared by main.py and holding_main.py
+"""
+import asyncio
+import logging
+import signal
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger('runner')
+
+
+# ============================================================================
+# TASK LIFECYCLE
+# ============================================================================
+
+async def cancel_task(task: Optional[asyncio.Task], label: str = "") -> bool:
+    """
+    Cancel a background task and wait for it to unwind
+    Returns True if the task was still running
+    """
+    if task is None:
+        return False
+    if task.done():
+        # Already finished - still retrieve a crash so it is logged, not raised or lost
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"{label or 'Task'} had failed: {task.exception()}")
+        return False
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.error(f"Error while stopping {label or 'task'}: {e}")
+
+    if label:
+        logger.info(f"✓ {label} stopped")
+    return True
+
+
+# ============================================================================
+# SIGNALS / ENTRY POINT
+# ============================================================================
+
+def install_uvloop() -> bool:
+    """Use the uvloop event loop when it is installed (pip install uvloop)"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    logger.info("✓ Using uvloop event loop")
+    return True
+
+
+def install_signal_handlers(handler: Callable):
+    """Route SIGINT (Ctrl+C) and SIGTERM (kill) to handler(signum, frame)"""
+    signal.signal(signal.SIGINT, handler)
+    signal.signal(signal.SIGTERM, handler)
+
+
+def run(main: Callable[[], Awaitable], on_abort: Optional[Callable[[], None]] = None):
+    """
+    Run a launcher's main() coroutine to completion (on uvloop when available)
+    on_abort (synchronous) runs if main is interrupted or raises
+    """
+    install_uvloop()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.critical("Interrupted - exiting")
+        if on_abort:
+            on_abort()
+    except Exception as e:
+        logger.critical(f"Top-level error: {e}", exc_info=True)
+        if on_abort:
+            on_abort()
+    finally:
+        logger.critical("Program terminated.")
@@ -72,7 +72,7 @@ class VideoRecorder:
 
     async def _run_adb(self, command):
         """Run ADB command asynchronously (non-blocking)"""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(executor, self._run_adb_sync, command)
 
     async def start_recording(self):